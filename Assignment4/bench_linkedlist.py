@@ -0,0 +1,164 @@
+"""
+Benchmarks for the LinkedListt team list.
+
+append: builds a list of N teams with append_team and times size(), len() and
+        get_tail(). A reference run that walks to the end for every insert (how
+        append_team used to work) is included up to --walk-limit teams.
+nodes:  allocates N LinkedListNode and N MatchHistoryNode objects and reports the
+        bytes per node (tracemalloc), next to copies of the node classes as they
+        were before __slots__ (a __dict__ per node, and a dictionary per match).
+sort:   sorts N random standings by (points, GD, power) with LinkedListt.merge_sort
+        (merge sort on the nodes) and LinkedListt.sort (copy into a list, list.sort,
+        relink), reporting time and peak extra memory (tracemalloc) for each.
+
+Usage:
+    python bench_linkedlist.py [--sizes 10000 100000 1000000] [--walk-limit 10000]
+                               [--only append|nodes|sort]
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from linkedlist import LinkedListNode, LinkedListt, MatchHistoryNode
+from standings import standings_key
+
+
+def make_team(i):
+    """Returns the team dictionary used for the i-th synthetic team."""
+    return {"name": f"Team{i}", "power": i % 5 + 1, "points": 0,
+            "wins": 0, "losses": 0, "draws": 0, "GD": 0}
+
+
+def walking_append(teams):
+    """Builds a list the old way: walk from the head to the end for every insert."""
+    linked = LinkedListt()
+    for team in teams:
+        new_node = LinkedListNode(team)
+        if not linked.head:
+            linked.head = new_node
+        else:
+            current = linked.head
+            while current.get_next():
+                current = current.get_next()
+            current.set_next(new_node)
+    return linked
+
+
+class DictNode:
+    """LinkedListNode as it was before __slots__."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next_node = None
+
+
+class DictMatchNode:
+    """MatchHistoryNode as it was before __slots__: a __dict__ plus a five-key dictionary."""
+
+    def __init__(self, game_number, team1, team2, team1_goals, team2_goals):
+        self.data = {"game_number": game_number, "team1": team1, "team2": team2,
+                     "team1_goals": team1_goals, "team2_goals": team2_goals}
+        self.next = None
+
+
+def random_standings(n, seed=0):
+    """Returns a LinkedListt of n teams with random points, GD and power."""
+    rng = random.Random(seed)
+    linked = LinkedListt()
+    for i in range(n):
+        team = make_team(i)
+        team["points"] = rng.randint(0, 3 * 30)
+        team["GD"] = rng.randint(-40, 40)
+        linked.append_team(team)
+    return linked
+
+
+def measure(sort_function, linked):
+    """Returns (seconds, peak bytes allocated) for one descending standings sort."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    sort_function(linked, key=standings_key, reverse=True)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_sort(sizes):
+    print(f"{'teams':>9} {'merge sort (s)':>15} {'peak (KiB)':>11} {'list sort (s)':>14} {'peak (KiB)':>11}")
+    for n in sizes:
+        merge_time, merge_peak = measure(LinkedListt.merge_sort, random_standings(n))
+        list_time, list_peak = measure(LinkedListt.sort, random_standings(n))
+        print(f"{n:>9} {merge_time:>15.4f} {merge_peak / 1024:>11.1f} "
+              f"{list_time:>14.4f} {list_peak / 1024:>11.1f}")
+
+
+def bytes_per_node(make_node, n):
+    """Returns the bytes allocated per node for n nodes made by make_node(i), chained together."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [make_node(i) for i in range(n)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    used -= sys.getsizeof(nodes) # count the nodes, not the list holding them
+    return used / n
+
+
+def bench_nodes(sizes):
+    team = make_team(0)
+    names = [f"Team{i}" for i in range(64)] # shared, as team names are in a real history
+    kinds = [
+        ("team node, __dict__", lambda i: DictNode(team)),
+        ("team node, __slots__", lambda i: LinkedListNode(team)),
+        ("match node, __dict__ + dict", lambda i: DictMatchNode(i, names[i % 64], names[i % 63], i % 5, i % 3)),
+        ("match node, __slots__", lambda i: MatchHistoryNode(i, names[i % 64], names[i % 63], i % 5, i % 3)),
+    ]
+    print(f"{'nodes':>9} " + " ".join(f"{label:>28}" for label, _ in kinds) + "  (bytes/node)")
+    for n in sizes:
+        print(f"{n:>9} " + " ".join(f"{bytes_per_node(make, n):>28.1f}" for _, make in kinds))
+
+
+def bench_append(sizes, walk_limit):
+    print(f"{'teams':>9} {'append (s)':>11} {'walking (s)':>12} {'size+len+tail (us)':>19}")
+    for n in sizes:
+        teams = [make_team(i) for i in range(n)]
+
+        start = time.perf_counter()
+        linked = LinkedListt()
+        for team in teams:
+            linked.append_team(team)
+        append_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert linked.size() == len(linked) == n
+        assert linked.get_tail().get_data() is teams[-1]
+        lookup_time = time.perf_counter() - start
+
+        walk = "skipped"
+        if n <= walk_limit:
+            start = time.perf_counter()
+            walking_append(teams)
+            walk = f"{time.perf_counter() - start:.4f}"
+        print(f"{n:>9} {append_time:>11.4f} {walk:>12} {lookup_time * 1e6:>19.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--walk-limit", type=int, default=10**4,
+                        help="largest list built with the walking append")
+    parser.add_argument("--only", choices=["append", "nodes", "sort"])
+    args = parser.parse_args()
+    if args.only in (None, "append"):
+        bench_append(args.sizes, args.walk_limit)
+    if args.only in (None, "nodes"):
+        bench_nodes(args.sizes)
+    if args.only in (None, "sort"):
+        bench_sort(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Scaling benchmark for the whole World Cup simulation.
+
+For each size (groups x teams per group) a seeded synthetic team file is
+written, then the tournament is run the way main runs it, without the
+prompts: initialize_teams -> group_stage_matches -> setup_knockout_round ->
+play_knockout_round until one team is left. The time and peak traced memory
+(tracemalloc) of each phase are printed as one row per size, so the rows form
+a scaling curve. A phase's peak includes the data earlier phases left behind
+(the teams, the history). Printing done by the simulation goes to os.devnull.
+
+Usage:
+    python bench_tournament.py [--sizes 8x4 1024x4 16384x4 65536x4] [--seed 0] [--no-memory]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from matchhistory import MatchHistory
+from synthetic import generate_teams
+from worldcup import group_stage_matches, initialize_teams, play_knockout_round, setup_knockout_round
+
+PHASES = ("load", "groups", "setup", "knockout")
+
+
+def parse_size(text):
+    """Reads a size written as GROUPSxTEAMS, e.g. 1024x4."""
+    try:
+        groups, teams_per_group = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a size like 1024x4.")
+    return groups, teams_per_group
+
+
+def run_phases(csv_file, seed, trace_memory=True):
+    """
+    Runs one tournament and returns (seconds, peak bytes) for each phase, in PHASES order.
+    The peak is 0 when trace_memory is False.
+    """
+    random.seed(seed)
+    results = []
+    state = {}
+
+    def load():
+        state["teams"], state["groups"] = initialize_teams(csv_file)
+
+    def groups():
+        state["history"] = MatchHistory()
+        group_stage_matches(state["groups"], state["history"])
+
+    def setup():
+        state["knockout"] = setup_knockout_round(state["groups"])
+
+    def knockout():
+        while state["knockout"].size() > 1:
+            play_knockout_round(state["knockout"], state["history"])
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        if trace_memory:
+            tracemalloc.start()
+        for phase in (load, groups, setup, knockout):
+            if trace_memory:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            phase()
+            elapsed = time.perf_counter() - start
+            results.append((elapsed, tracemalloc.get_traced_memory()[1] if trace_memory else 0))
+        if trace_memory:
+            tracemalloc.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each phase of the tournament at growing sizes.")
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[(8, 4), (1024, 4), (16384, 4), (65536, 4)])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip tracemalloc (it slows the run down)")
+    args = parser.parse_args()
+
+    header = f"{'groups':>8} {'x':>1} {'teams':>5} {'total':>9}"
+    for phase in PHASES:
+        header += f" {phase + ' (s)':>13} {'peak (MB)':>10}"
+    print(header)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for groups, teams_per_group in args.sizes:
+            csv_file = os.path.join(directory, f"teams_{groups}x{teams_per_group}.csv")
+            teams = generate_teams(csv_file, groups, teams_per_group, args.seed)
+            row = f"{groups:>8} {'x':>1} {teams_per_group:>5} {teams:>9}"
+            for elapsed, peak in run_phases(csv_file, args.seed, not args.no_memory):
+                row += f" {elapsed:>13.3f} {peak / 2 ** 20:>10.1f}"
+            print(row, flush=True)
+            os.remove(csv_file)
+
+
+if __name__ == "__main__":
+    main()
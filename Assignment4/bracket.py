@@ -0,0 +1,135 @@
+"""
+Array-backed knockout bracket.
+
+Entrants are numbered 0..n-1 in seeding order and every round is a contiguous
+array('i') of entrant numbers: round 0 is every entrant, and round r + 1 holds
+the winners of the pairs (0, 1), (2, 3), ... of round r. A round is played in
+one pass over its array, so a whole knockout is O(n) matches and O(n) memory,
+with no searching or deleting of losers. If a round has an odd number of teams
+the last one has a bye into the next round.
+
+Usage (timing):
+    python bracket.py [--entrants 1048576] [--seed 0]
+"""
+import argparse
+import random
+import time
+from array import array
+
+
+class Bracket:
+    """
+    A single-elimination bracket.
+
+    Attributes:
+        teams (list): Entrant data (team dictionaries or TeamViews) by entrant number.
+        rounds (list): One array('i') of entrant numbers per round played so far,
+                       starting with every entrant.
+    """
+
+    def __init__(self, teams):
+        """
+        Creates a bracket in which teams[0] plays teams[1], teams[2] plays teams[3], and so on.
+
+        Parameters:
+            teams (list): The entrants' data, in bracket order.
+        """
+        self.teams = list(teams)
+        self.rounds = [array('i', range(len(self.teams)))]
+
+    @classmethod
+    def from_list(cls, knockout_list):
+        """Creates a bracket from a LinkedListt, in list order."""
+        teams = []
+        current = knockout_list.head
+        while current:
+            teams.append(current.get_data())
+            current = current.get_next()
+        return cls(teams)
+
+    def __len__(self):
+        """Returns the number of entrants."""
+        return len(self.teams)
+
+    def remaining(self):
+        """Returns the data of the teams still in the bracket, in bracket order."""
+        teams = self.teams
+        return [teams[i] for i in self.rounds[-1]]
+
+    def is_decided(self):
+        """Returns True when at most one team is left."""
+        return len(self.rounds[-1]) <= 1
+
+    def champion(self):
+        """Returns the winner's data, or None if the bracket is not decided yet (or empty)."""
+        last = self.rounds[-1]
+        return self.teams[last[0]] if len(last) == 1 else None
+
+    def play_round(self, match_play, rng=random):
+        """
+        Plays every match of the current round in one pass and adds the next round.
+
+        Parameters:
+            match_play (function): (team1, team2, rng) -> (winner, loser), e.g. knockout_match_play.
+            rng (random.Random or module, optional): Passed on to match_play.
+
+        Returns:
+            list: (winner, loser) team data for each match, in bracket order.
+
+        Raises:
+            ValueError: If the bracket is already decided.
+        """
+        current = self.rounds[-1]
+        if len(current) <= 1:
+            raise ValueError("The bracket is already decided.")
+
+        teams = self.teams
+        winners = array('i')
+        results = []
+        for i in range(0, len(current) - 1, 2):
+            team1 = teams[current[i]]
+            winner, loser = match_play(team1, teams[current[i + 1]], rng)
+            winners.append(current[i] if winner is team1 else current[i + 1])
+            results.append((winner, loser))
+        if len(current) % 2:
+            winners.append(current[-1]) # bye
+        self.rounds.append(winners)
+        return results
+
+    def play(self, match_play, rng=random):
+        """
+        Plays rounds until one team is left.
+
+        Returns:
+            The champion's data, or None for an empty bracket.
+        """
+        while not self.is_decided():
+            self.play_round(match_play, rng)
+        return self.champion()
+
+
+def main():
+    # Imported here so worldcup can import this module
+    from worldcup import knockout_match_play
+
+    parser = argparse.ArgumentParser(description="Time a full knockout bracket.")
+    parser.add_argument("--entrants", type=int, default=2 ** 20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    teams = [{"name": f"Team{i}", "power": rng.randint(1, 5)} for i in range(args.entrants)]
+
+    start = time.perf_counter()
+    bracket = Bracket(teams)
+    champion = bracket.play(knockout_match_play, rng)
+    elapsed = time.perf_counter() - start
+
+    matches = max(len(bracket) - 1, 0)
+    print(f"{len(bracket):,} entrants, {len(bracket.rounds) - 1} rounds, {matches:,} matches "
+          f"in {elapsed:.2f} s ({matches / elapsed:,.0f} matches/second)")
+    print(f"Champion: {champion['name'] if champion else None}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Batched group stage simulation on a TeamTable.
+
+Instead of walking each group's linked list and playing one fixture at a time, a
+group is turned into index arrays of every pairing, all goals for the group are
+drawn in one pass, and the results are added into the table's columns.
+
+The outcome follows simulate_match: each team scores uniformly in
+0..max(1, |power1 - power2| // 2), a win is worth 3 points and a draw 1, and GD
+changes by the goal difference. Fixtures are played in the same order as
+group_stage_matches (each team against every team after it), and goals are drawn
+team1 then team2, so with the same random generator and seed the goals, history
+and statistics are exactly those of calling simulate_match on every fixture, or
+of group_stage_matches.
+"""
+import random
+from array import array
+
+
+def round_robin_pairs(num_teams):
+    """
+    Returns every pairing of num_teams teams as two index arrays, in group_stage_matches order.
+
+    Returns:
+        tuple: array('i') of first positions and array('i') of second positions.
+    """
+    first = array('i')
+    second = array('i')
+    for i in range(num_teams):
+        opponents = range(i + 1, num_teams)
+        first.extend([i] * len(opponents))
+        second.extend(opponents)
+    return first, second
+
+
+def group_ids(group):
+    """Returns the TeamTable ids of a group's teams (nodes holding TeamViews), in list order."""
+    ids = array('i')
+    current = group.head
+    while current:
+        ids.append(current.get_data().id)
+        current = current.get_next()
+    return ids
+
+
+def simulate_group(table, team_ids, rng=random, match_history=None, first_game=1):
+    """
+    Plays every fixture of one group and adds the results into the table.
+
+    Parameters:
+        table (TeamTable): The team statistics.
+        team_ids (array): Ids of the group's teams, in group order.
+        rng (random.Random or module, optional): Source of the goals. Defaults to the random module.
+        match_history (MatchHistoryLinkedList, optional): Record every fixture here.
+        first_game (int, optional): Game number of the group's first fixture.
+
+    Returns:
+        tuple: array('i') of team1 ids, team2 ids, team1 goals and team2 goals, one entry per fixture.
+    """
+    first, second = round_robin_pairs(len(team_ids))
+    team1 = array('i', [team_ids[i] for i in first])
+    team2 = array('i', [team_ids[i] for i in second])
+
+    # Goal ranges for every fixture, then all goals in one pass: team1, team2, team1, ...
+    power = table.power
+    ranges = [max(1, abs(power[a] - power[b]) // 2) for a, b in zip(team1, team2)]
+    randint = rng.randint
+    goals = array('i', [randint(0, r) for r in ranges for _ in (0, 1)])
+    goals1 = goals[0::2]
+    goals2 = goals[1::2]
+
+    # Scatter the results into the columns
+    table.record_results(team1, team2, goals1, goals2)
+
+    if match_history is not None:
+        names = table.names
+        for game_number, (a, b, ga, gb) in enumerate(zip(team1, team2, goals1, goals2), first_game):
+            match_history.add_match(game_number, names[a], names[b], ga, gb)
+
+    return team1, team2, goals1, goals2
+
+
+def simulate_group_stage(table, groups, match_history=None, rng=random):
+    """
+    Plays the whole group stage with simulate_group and puts every group in standings order.
+
+    Parameters:
+        table (TeamTable): The table the groups' TeamViews belong to.
+        groups (list): LinkedListt groups built by initialize_teams.
+        match_history (MatchHistoryLinkedList, optional): Record every fixture here.
+        rng (random.Random or module, optional): Source of the goals.
+
+    Returns:
+        list: The groups, each sorted by points, GD and power.
+    """
+    game_number = 1
+    for group in groups:
+        team1, _, _, _ = simulate_group(table, group_ids(group), rng, match_history, game_number)
+        game_number += len(team1)
+        standings = group.standings
+        if standings is None:
+            standings = group.get_standings() # built from the results just recorded
+        else:
+            # The results went straight into the table, so move the teams in the kept standings
+            for team in group:
+                standings.update(team["name"])
+        standings.relink()
+    return groups
@@ -0,0 +1,170 @@
+"""
+Exact group stage probabilities, without sampling.
+
+In simulate_match both teams score uniformly in 0..goal_range, with
+goal_range = max(1, |power1 - power2| // 2), so a fixture's goal difference d
+has (goal_range + 1 - |d|) of the (goal_range + 1) ** 2 equally likely scores.
+Points and GD only depend on d, so the group is solved by dynamic programming
+over the fixtures in group_stage_matches order: the state is every team's
+(points, GD), and each fixture spreads every state over its possible goal
+differences. States reached in different ways are merged, so each shared
+sub-state is expanded once.
+
+Weights are whole numbers (counts of equally likely score sequences) over one
+common denominator, so the results are exact; they are returned as Fractions.
+Qualification follows promote_teams: the group is ranked by points, then GD,
+then power, equal teams keep their group order, and the top two go through.
+
+Usage:
+    python groupodds.py [--csv teams.csv] [--group A]
+"""
+import argparse
+import time
+from fractions import Fraction
+
+from teamloader import load_teams
+
+QUALIFIERS = 2 # teams promote_teams takes from each group
+
+_fixture_cache = {} # goal range -> list of (goal difference, weight)
+
+
+def match_goal_range(power1, power2):
+    """Returns the highest score either team can get in a simulate_match fixture."""
+    return max(1, abs(power1 - power2) // 2)
+
+
+def fixture_outcomes(goal_range):
+    """
+    Returns the goal differences of a fixture and how many of the equally likely scores give each.
+
+    Returns:
+        list: (goal difference, weight) pairs. The weights add up to (goal_range + 1) ** 2.
+    """
+    outcomes = _fixture_cache.get(goal_range)
+    if outcomes is None:
+        outcomes = [(d, goal_range + 1 - abs(d)) for d in range(-goal_range, goal_range + 1)]
+        _fixture_cache[goal_range] = outcomes
+    return outcomes
+
+
+class GroupOdds:
+    """
+    The exact outcome distribution of one group.
+
+    Attributes:
+        names (list): Team names in group order.
+        total (int): Common denominator of all the weights below.
+        standings (list): For each team, a dict (points, GD) -> weight of finishing with them.
+        places (list): For each team, the weight of finishing 1st, 2nd, ...
+        states (int): Number of distinct group states after the last fixture.
+    """
+
+    def __init__(self, names, total):
+        self.names = names
+        self.total = total
+        self.standings = [{} for _ in names]
+        self.places = [[0] * len(names) for _ in names]
+        self.states = 0
+
+    def place_probability(self, team, place):
+        """Returns the probability that a team (by group position) finishes in place (1-based)."""
+        return Fraction(self.places[team][place - 1], self.total)
+
+    def qualify_probability(self, team, qualifiers=QUALIFIERS):
+        """Returns the probability that a team (by group position) is promoted."""
+        return Fraction(sum(self.places[team][:qualifiers]), self.total)
+
+    def standing_probabilities(self, team):
+        """Returns a dict (points, GD) -> probability of a team (by group position) finishing with them."""
+        return {standing: Fraction(weight, self.total) for standing, weight in sorted(self.standings[team].items())}
+
+    def expected_points(self, team):
+        return Fraction(sum(points * weight for (points, _), weight in self.standings[team].items()), self.total)
+
+    def __str__(self):
+        lines = [f"| {'Team':<14} | {'Qualify':>8} | {'1st':>7} | {'Points':>6} |"]
+        for i, name in enumerate(self.names):
+            lines.append(f"| {name:<14} | {float(self.qualify_probability(i)):>8.2%} | "
+                         f"{float(self.place_probability(i, 1)):>7.2%} | {float(self.expected_points(i)):>6.2f} |")
+        return "\n".join(lines)
+
+
+def exact_group_odds(teams):
+    """
+    Computes the exact distribution of a group's final standings.
+
+    Parameters:
+        teams (list): Team dictionaries (or TeamViews) in group order. Their current points
+                      and GD are the starting point (0 before the group stage), and every
+                      pair of teams plays once from there.
+
+    Returns:
+        GroupOdds: The distribution of every team's final (points, GD) and place.
+    """
+    n = len(teams)
+    powers = [team["power"] for team in teams]
+    start = tuple(value for team in teams for value in (team["points"], team["GD"]))
+
+    # One fixture at a time: state (points0, GD0, points1, GD1, ...) -> weight
+    states = {start: 1}
+    total = 1
+    for i in range(n):
+        for j in range(i + 1, n):
+            goal_range = match_goal_range(powers[i], powers[j])
+            total *= (goal_range + 1) ** 2
+            outcomes = fixture_outcomes(goal_range)
+            next_states = {}
+            for state, weight in states.items():
+                for d, ways in outcomes:
+                    new = list(state)
+                    if d > 0:
+                        new[2 * i] += 3
+                    elif d < 0:
+                        new[2 * j] += 3
+                    else:
+                        new[2 * i] += 1
+                        new[2 * j] += 1
+                    new[2 * i + 1] += d
+                    new[2 * j + 1] -= d
+                    new = tuple(new)
+                    next_states[new] = next_states.get(new, 0) + weight * ways
+            states = next_states
+
+    odds = GroupOdds([team["name"] for team in teams], total)
+    odds.states = len(states)
+    for state, weight in states.items():
+        order = sorted(range(n), key=lambda t: (-state[2 * t], -state[2 * t + 1], -powers[t], t))
+        for place, t in enumerate(order):
+            odds.places[t][place] += weight
+            standing = (state[2 * t], state[2 * t + 1])
+            odds.standings[t][standing] = odds.standings[t].get(standing, 0) + weight
+    return odds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact group stage probabilities for every team.")
+    parser.add_argument("--csv", default="teams.csv")
+    parser.add_argument("--group", help="only this group (A, B, ...)")
+    args = parser.parse_args()
+
+    all_teams, groups = load_teams(args.csv)
+    for index, group in enumerate(groups):
+        letter = chr(65 + index)
+        if args.group and args.group.upper() != letter:
+            continue
+        teams = []
+        current = group.head
+        while current:
+            teams.append(current.get_data())
+            current = current.get_next()
+
+        start = time.perf_counter()
+        odds = exact_group_odds(teams)
+        elapsed = time.perf_counter() - start
+        print(f"\nGroup {letter} ({odds.states:,} final states, {elapsed * 1000:.1f} ms):")
+        print(odds)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,22 @@
+import heapq
 import random
+import sys
+from itertools import islice
+
+from standings import Standings, standings_key
                 
 class LinkedListNode:
     """
     # an instance of this class is a node in a Single Linked List
+    # (slotted: no per-node __dict__, so a node is 48 bytes instead of about 100)
 
     Parameters:
             data (dict): A dictionary containing team information.
             Includes "Team name", "power", "points", "wins", "losses", "draws", and "GD".
     """
 
+    __slots__ = ("data", "next_node")
+
     def __init__(self, data):
         """
         Initializes a node with the provided data.
@@ -69,16 +77,31 @@ class LinkedListt:
 
     Attributes:
         head (LinkedListNode): The head node of the linked list.
+        tail (LinkedListNode): The last node of the linked list.
+        count (int): The number of nodes, kept up to date so size() does not walk the list.
+        index (dict): Team name -> node, or None when the list is not indexed.
+        prev_index (dict): Team name -> the node before it (None for the head), or None when not indexed.
+        standings (Standings): The live standings built by get_standings, or None. Adding,
+                               deleting, replacing or sorting teams drops them.
     """
 
-    def __init__(self):
+    def __init__(self, indexed=False):
         """
         Initializes an empty linked list.
 
+        Parameters:
+            indexed (bool, optional): Keep a name index so find, delete and update_team_points
+                                      are O(1). Team names must then be unique. Defaults to False.
+
         Returns:
             None
         """
         self.head = None
+        self.tail = None
+        self.count = 0
+        self.index = {} if indexed else None
+        self.prev_index = {} if indexed else None
+        self.standings = None
 
     
 
@@ -90,13 +113,36 @@ class LinkedListt:
         team (dict): A dictionary containing team data.
         """
         new_node = LinkedListNode(team)
+        self.standings = None
+        if self.index is not None:
+            if team["name"] in self.index:
+                raise ValueError(f"Team '{team['name']}' is already in the list.")
+            self.index[team["name"]] = new_node
+            self.prev_index[team["name"]] = self.tail
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.get_next():
-                current = current.get_next()
-            current.set_next(new_node)
+            self.tail.set_next(new_node) # link straight after the tail, no walk needed
+        self.tail = new_node
+        self.count += 1
+
+    def find(self, team_name):
+        """
+        Returns the node of a team by its name.
+    
+        Parameters:
+        team_name (str): The name of the team to find.
+
+        Returns:
+            LinkedListNode: The team's node, or None if the team is not in the list.
+        """
+        if self.index is not None:
+            return self.index.get(team_name)
+
+        current = self.head
+        while current and current.get_data()["name"] != team_name:
+            current = current.get_next()
+        return current
 
     def delete(self, team_name):
         """
@@ -109,24 +155,56 @@ class LinkedListt:
             print("The list is empty.")
             return
 
-        # If the team is at the head
-        if self.head.get_data()["name"] == team_name:
-            self.head = self.head.get_next()
-            return
-
-        # Traverse to find and delete the team
-        current = self.head
-        previous = None
-        while current and current.get_data()["name"] != team_name:
-            previous = current
-            current = current.get_next()
+        if self.index is not None:
+            # Look the team and the node before it up directly
+            current = self.index.get(team_name)
+            previous = self.prev_index.get(team_name)
+        else:
+            # Traverse to find the team
+            current = self.head
+            previous = None
+            while current and current.get_data()["name"] != team_name:
+                previous = current
+                current = current.get_next()
 
         if not current:
             print(f"Team '{team_name}' not found.")
             return
 
         # Remove the team
-        previous.set_next(current.get_next())
+        self.standings = None
+        next_node = current.get_next()
+        if previous is None: # the team is at the head
+            self.head = next_node
+        else:
+            previous.set_next(next_node)
+        if current is self.tail:
+            self.tail = previous
+        self.count -= 1
+
+        if self.index is not None:
+            del self.index[team_name]
+            del self.prev_index[team_name]
+            if next_node:
+                self.prev_index[next_node.get_data()["name"]] = previous
+
+    def replace(self, teams):
+        """
+        Replaces every team in the list with the given teams, in order, in O(n).
+        The count and (for an indexed list) the name indexes are rebuilt with them.
+
+        Parameters:
+        teams (iterable): The team data to put in the list.
+        """
+        self.head = None
+        self.tail = None
+        self.count = 0
+        self.standings = None
+        if self.index is not None:
+            self.index.clear()
+            self.prev_index.clear()
+        for team in teams:
+            self.append_team(team)
 
 
 
@@ -135,6 +213,9 @@ class LinkedListt:
         """
         Sorts the linked list in-place based on the provided key function.
 
+        The nodes are put in a Python list, sorted with list.sort (stable) and relinked.
+        merge_sort gives the same order without building the list, but is slower.
+
         Parameters:
             key (function, optional): A function that takes a team data dictionary
                                       and returns a value to sort by. If None, sorts by the
@@ -143,6 +224,7 @@ class LinkedListt:
         """
         if not self.head or not self.head.next_node:
             return # Nothing to sort if list is empty or has only one element
+        self.standings = None
 
         nodes = []
         current = self.head
@@ -150,18 +232,123 @@ class LinkedListt:
             nodes.append(current)
             current = current.get_next()
 
-        self.head = None # Temporarily detach the list for sorting
-
         # Sort the nodes list based on the key function:
         nodes.sort(key=lambda node: key(node.data) if key else node.data, reverse=reverse)
 
         # Reconstruct the linked list from the sorted nodes:
         self.head = nodes[0]
+        previous = None
+        for node in nodes:
+            if previous is not None:
+                previous.next_node = node
+            if self.prev_index is not None:
+                self.prev_index[node.data["name"]] = previous
+            previous = node
+        previous.next_node = None # Ensure the tail's next is None
+        self.tail = previous
+
+    def merge_sort(self, key=None, reverse=False):
+        """
+        Sorts the linked list in-place like sort, by relinking the nodes rather than sorting a list of them.
+
+        This is a stable bottom-up merge sort that relinks the nodes themselves: runs of
+        1, 2, 4, ... nodes are merged pairwise until one run is left. Each key is computed
+        once and kept in a node -> key dictionary that only lives while sorting, so the
+        nodes carry nothing extra. It is several times slower than sort in CPython.
+
+        Parameters:
+            key (function, optional): A function that takes a team data dictionary
+                                      and returns a value to sort by. If None, sorts by the
+                                      dictionary itself. Defaults to None.
+            reverse (bool, optional): Whether to sort in descending order. Defaults to False.
+        """
+        if not self.head or not self.head.next_node:
+            return # Nothing to sort if list is empty or has only one element
+        self.standings = None
+
+        # Compute the keys, noting whether the list is already in order
+        keys = {}
+        in_order = True
+        previous_key = None
         current = self.head
-        for i in range(1, len(nodes)):
-            current.set_next(nodes[i])
-            current = current.get_next()
-        current.set_next(None) # Ensure the tail's next is None
+        while current:
+            current_key = keys[current] = key(current.data) if key else current.data
+            if current is not self.head and in_order:
+                if (previous_key < current_key) if reverse else (current_key < previous_key):
+                    in_order = False
+            previous_key = current_key
+            current = current.next_node
+        if in_order:
+            return # nothing moves, so the tail and prev_index are already right
+
+        dummy = LinkedListNode(None) # placeholder in front of the head while relinking
+        dummy.next_node = self.head
+        width = 1
+        while True:
+            merged_tail = dummy
+            current = dummy.next_node
+            merges = 0
+            while current:
+                left = current
+                right = self._split_after(left, width)
+                current = self._split_after(right, width)
+                merged_tail = self._merge_runs(left, right, merged_tail, keys, reverse)
+                merges += 1
+            if merges <= 1: # the whole list was a single merge: it is sorted
+                break
+            width *= 2
+        self.head = dummy.next_node
+
+        # Final pass: fix the tail and (every node may have a new predecessor) prev_index
+        previous = None
+        current = self.head
+        while current:
+            if self.prev_index is not None:
+                self.prev_index[current.data["name"]] = previous
+            previous = current
+            current = current.next_node
+        self.tail = previous
+
+    @staticmethod
+    def _split_after(run, width):
+        """
+        Cuts the list after the first width nodes of run.
+
+        Returns:
+            LinkedListNode: The first node after the cut, or None.
+        """
+        for _ in range(width - 1):
+            if not run:
+                break
+            run = run.next_node
+        if not run:
+            return None
+        rest = run.next_node
+        run.next_node = None
+        return rest
+
+    @staticmethod
+    def _merge_runs(left, right, merged_tail, keys, reverse):
+        """
+        Merges two sorted runs after merged_tail, keeping equal keys in their original order.
+        keys maps each node to its sort key. Only < is used on the keys, like list.sort.
+
+        Returns:
+            LinkedListNode: The last node of the merged run.
+        """
+        while left and right:
+            if (keys[left] < keys[right]) if reverse else (keys[right] < keys[left]):
+                merged_tail.next_node = right
+                right = right.next_node
+            else:
+                merged_tail.next_node = left
+                left = left.next_node
+            merged_tail = merged_tail.next_node
+
+        merged_tail.next_node = left if left else right
+        while merged_tail.next_node:
+            merged_tail = merged_tail.next_node
+        return merged_tail
 
 
 
@@ -174,59 +361,105 @@ class LinkedListt:
             new_points (int): The new points to assign to the team.
             """
 
-            current = self.head
-            while current:
+            current = self.find(team_name)
+            if current:
                 team_data = current.get_data()
-                if team_data["name"] == team_name: # Access "name" from the dictionary
-                    team_data["points"] = new_points # Update "points" within the dictionary
-                    current.set_data(team_data) # Very important, update the node's data
-                    return
-                current = current.get_next()
+                team_data["points"] = new_points # Update "points" within the dictionary
+                current.set_data(team_data) # Very important, update the node's data
+                if self.standings is not None:
+                    self.standings.update(team_name)
+                return
 
             print(f"Team '{team_name}' not found in the list.") # Or raise exception
 
 
-    def display_rankings(self): # Now a method of LinkedListt to display its own rankings
-            """Displays team rankings within the current linked list."""
-            print("-------------------------------------------------------")
-            print("| Team         | Points | Wins | Draws | Losses | GD |")
-            print("-------------------------------------------------------")
+    def __iter__(self):
+        """
+        Iterates over the team data from head to tail, one node at a time (no list is built).
+        Do not add or delete teams while iterating.
+        """
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next_node
 
-            current = self.head
-            while current:
-                team_data = current.get_data()
-                print(f"| {team_data['name']:<12} | {team_data['points']:>6} | {team_data['wins']:>4} | {team_data['draws']:>5} | {team_data['losses']:>6} | {team_data['GD']:>3} |")
-                current = current.get_next()
-          
-            print("-------------------------------------------------------")
+    def nodes(self):
+        """Iterates over the nodes themselves, from head to tail."""
+        current = self.head
+        while current:
+            yield current
+            current = current.next_node
+
+    def slice(self, start=0, stop=None):
+        """Iterates over the team data at positions start..stop-1, stopping the walk at stop."""
+        return islice(self, start, stop)
+
+    def filter(self, predicate):
+        """Iterates over the team data for which predicate(team) is true."""
+        return (team for team in self if predicate(team))
+
+    def top(self, k, key=standings_key):
+        """
+        Returns the k highest teams by key, highest first, keeping only k teams while walking
+        the list (O(n log k)). Equal teams stay in list order, as in a stable sort.
+
+        Parameters:
+            k (int): How many teams to return.
+            key (function, optional): Ranks a team's data. Defaults to standings_key
+                                      (points, then GD, then power).
+        """
+        return heapq.nlargest(k, self, key=key)
+
+    def get_standings(self):
+        """
+        Returns the list's live Standings, building them from the current order the first
+        time (O(n log n) once). Later calls return the same standings, which results keep
+        up to date one team at a time.
+        """
+        if self.standings is None:
+            self.standings = Standings(self)
+        return self.standings
+
+    def format_rankings(self, teams=None):
+        """
+        Returns the rankings table as one string.
+
+        Parameters:
+            teams (iterable, optional): The team data to show, e.g. self.slice(0, 2) or
+                                        self.filter(...). Defaults to the whole list.
+        """
+        rule = "-------------------------------------------------------"
+        rows = [rule, "| Team         | Points | Wins | Draws | Losses | GD |", rule]
+        rows.extend(f"| {team_data['name']:<12} | {team_data['points']:>6} | {team_data['wins']:>4} | {team_data['draws']:>5} | {team_data['losses']:>6} | {team_data['GD']:>3} |"
+                    for team_data in (self if teams is None else teams))
+        rows.append(rule)
+        return "\n".join(rows) + "\n"
+
+    def display_rankings(self): # Now a method of LinkedListt to display its own rankings
+            """Displays team rankings within the current linked list, in one write."""
+            sys.stdout.write(self.format_rankings())
 
 
     def extract_teams_from_group(group): 
         """Extracts teams from the current linked list and returns a list of team data dictionaries."""
         teams = []
-        current = group.head
 
-        if not current:
+        if not group.head:
             print("Warning: Group is empty (head is None).")
             return teams # Return empty list if group is empty
         
-        while current:
-            team_data = current.get_data()
+        for team_data in group:
             if team_data is None:
                 print("Error: Found a node with no data.")
                 return [] # Return empty list if node data is missing
             teams.append(team_data.copy()) # Append copies to prevent modification of original data
 
-            current = current.get_next()
-
         return teams
 
     def display_group_rankings(groups): 
         """Displays rankings for all groups."""
-        for i, group in enumerate(groups):
-            group_name = chr(ord('A') + i) # Get group name (A, B, C, etc.)
-            print(f"\nRankings for Group {group_name}:")
-            group.display_rankings() # Call display_rankings on each group (LinkedListt)
+        sys.stdout.write("".join(f"\nRankings for Group {chr(ord('A') + i)}:\n" + group.format_rankings()
+                                 for i, group in enumerate(groups)))
 
     
 
@@ -234,12 +467,7 @@ class LinkedListt:
         """
         Returns the number of nodes (teams) in the linked list.
         """
-        count = 0
-        current = self.head
-        while current is not None:
-            count += 1
-            current = current.getNext()
-        return count
+        return self.count
 
 
 
@@ -250,12 +478,18 @@ class LinkedListt:
         Returns:
             int: The number of nodes in the linked list.
         """
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.get_next()
-        return count
+        return self.count
+
+
+
+    def get_tail(self):
+        """
+        Returns the last node in the linked list.
+
+        Returns:
+            LinkedListNode: The tail node, or None if the list is empty.
+        """
+        return self.tail
 
 
 
@@ -296,25 +530,42 @@ class LinkedListt:
 
 
 class MatchHistoryNode:
-    """Node class to represent a match in the match history linked list."""
+    """
+    Node class to represent a match in the match history linked list.
+    The match fields are stored as slots on the node itself; get_data() builds the
+    usual dictionary on request. prev links back to the previous match, so the most
+    recent matches can be reached from the tail.
+    """
+
+    __slots__ = ("game_number", "team1", "team2", "team1_goals", "team2_goals", "next", "prev")
+
     def __init__(self, game_number, team1, team2, team1_goals, team2_goals):
-        self.data = {
-            "game_number": game_number,
-            "team1": team1,
-            "team2": team2,
-            "team1_goals": team1_goals,
-            "team2_goals": team2_goals
-        }
+        self.game_number = game_number
+        self.team1 = team1
+        self.team2 = team2
+        self.team1_goals = team1_goals
+        self.team2_goals = team2_goals
         self.next = None
+        self.prev = None
 
     def get_data(self):
-        return self.data
+        return {
+            "game_number": self.game_number,
+            "team1": self.team1,
+            "team2": self.team2,
+            "team1_goals": self.team1_goals,
+            "team2_goals": self.team2_goals
+        }
 
     def set_next(self, next_node):
         self.next = next_node
 
     def get_next(self):
         return self.next
+
+    def format(self):
+        """Returns the match as the line display_history shows for it."""
+        return f"Game {self.game_number}: {self.team1} {self.team1_goals} - {self.team2_goals} {self.team2}"
     
 
 
@@ -332,13 +583,64 @@ class MatchHistoryLinkedList:
             self.head = new_node
         else:
             self.tail.set_next(new_node)
+            new_node.prev = self.tail
         self.tail = new_node
         self.size += 1
 
-    def display_history(self):
-        """Prints all matches in the history."""
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Iterates over the match nodes, oldest first, without building a list."""
         current = self.head
         while current:
-            match = current.get_data()
-            print(f"Game {match['game_number']}: {match['team1']} {match['team1_goals']} - {match['team2_goals']} {match['team2']}")
-            current = current.get_next()
+            yield current
+            current = current.next
+
+    def __reversed__(self):
+        """Iterates over the match nodes, newest first."""
+        current = self.tail
+        while current:
+            yield current
+            current = current.prev
+
+    def matches(self, start=0, stop=None, team=None):
+        """
+        Iterates over the match nodes at positions start..stop-1, oldest first, optionally only
+        those in which team played. The walk stops at stop.
+
+        Raises:
+            ValueError: If start or stop is negative (use last(k) for the most recent matches).
+        """
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("start and stop cannot be negative; use last(k) for the most recent matches.")
+        nodes = islice(self, start, stop)
+        if team is None:
+            return nodes
+        return (node for node in nodes if team in (node.team1, node.team2))
+
+    def last(self, k):
+        """Iterates over the last k match nodes, oldest first, in O(k) (walking back from the tail)."""
+        node = self.tail
+        for _ in range(k - 1):
+            if node is None or node.prev is None:
+                break
+            node = node.prev
+        for _ in range(k):
+            if node is None:
+                break
+            yield node
+            node = node.next
+
+    def format_history(self, matches=None):
+        """Returns the lines for the given match nodes (default: all of them) as one string."""
+        return "".join(node.format() + "\n" for node in (self if matches is None else matches))
+
+    def display_history(self, matches=None):
+        """
+        Prints the matches in one write.
+
+        Parameters:
+            matches (iterable, optional): Match nodes to show, e.g. self.last(20). Defaults to all.
+        """
+        sys.stdout.write(self.format_history(matches))
@@ -0,0 +1,531 @@
+"""
+Columnar, append-only match history.
+
+A drop-in for MatchHistoryLinkedList (add_match, size, iteration, matches,
+last, format_history and display_history) that keeps every match as one entry
+in five typed arrays (game number, team 1 id, team 2 id, team 1 goals, team 2
+goals) instead of a node holding a dictionary. Team names are stored once and
+referred to by id. A match costs 20 bytes, so a million matches take about
+20 MB instead of several hundred.
+
+add_match also keeps each team's match positions (8 bytes per match). A team's
+last k results and form are found in O(k), and head_to_head_games walks the
+positions of whichever of the two teams played fewer matches, never the whole
+history. head_to_head summaries come from running totals per pair of teams (one
+int key and five 8-byte totals per pair, no positions), built in one pass on
+the first head_to_head call and kept up to date by add_match after that, so a
+summary is O(1) and histories that are never asked for one pay nothing.
+
+The arrays are split into chunks of CHUNK_SIZE matches. Appending never copies
+earlier matches: a full chunk is left alone and a new one is started.
+
+Binary format (little-endian):
+
+    magic "WCMH" | version B | matches Q | teams I | names block length I
+    | each name as its UTF-8 length I and bytes | game numbers | team 1 ids | team 2 ids | team 1 goals | team 2 goals (int32 each)
+
+Usage (memory, speed and query comparison with MatchHistoryLinkedList):
+    python matchhistory.py [--matches 1000000] [--workload random|round-robin]
+"""
+import argparse
+import csv
+import random
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import islice
+
+CHUNK_SIZE = 65536 # matches per chunk
+COLUMNS = ("game_number", "team1", "team2", "team1_goals", "team2_goals")
+MAGIC = b'WCMH'
+VERSION = 2 # 2: names are length-prefixed, so they may contain newlines
+HEADER = struct.Struct('<4sBQII')
+PAIR_FIELDS = 5 # totals kept per pair: lower id wins, higher id wins, draws, lower id goals, higher id goals
+NAME_LENGTH = struct.Struct('<I')
+
+
+class Match(namedtuple("Match", COLUMNS)):
+    """
+    One match, as iterating over a MatchHistory yields it. It has the same fields and
+    format() as a MatchHistoryNode, so code that reads matches works with either store.
+    """
+
+    __slots__ = ()
+
+    def get_data(self):
+        return self._asdict()
+
+    def format(self):
+        """Returns the match as the line display_history shows for it."""
+        return f"Game {self.game_number}: {self.team1} {self.team1_goals} - {self.team2_goals} {self.team2}"
+
+
+def _little_endian(column):
+    """Returns the bytes of an array('i') in little-endian order."""
+    if sys.byteorder == 'big':
+        column = array('i', column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class MatchHistory:
+    """
+    The history of matches played, stored by column.
+
+    Attributes:
+        size (int): Number of matches recorded.
+        names (list): Team name by team id.
+        ids (dict): Team name -> team id.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty history.
+        """
+        self.size = 0
+        self.names = []
+        self.ids = {}
+        self.__chunks = [] # each a list of five array('i'), one per column
+        self.__chunk_firsts = array('i') # first game number of each chunk
+        self.__ordered = True # game numbers never went down, so ranges can be binary searched
+        self.__last_game = None
+        self.__team_positions = [] # team id -> array('i') of the positions of its matches
+        self.__pair_slots = None # lower id << 32 | higher id -> slot in __pair_totals, built by head_to_head
+        self.__pair_totals = array('q') # PAIR_FIELDS totals per slot
+
+    def team_id(self, name):
+        """Returns the id of a team name, adding the name if it is new."""
+        team_id = self.ids.get(name)
+        if team_id is None:
+            name = sys.intern(name)
+            team_id = len(self.names)
+            self.names.append(name)
+            self.ids[name] = team_id
+            self.__team_positions.append(array('i'))
+        return team_id
+
+    def add_match(self, game_number, team1, team2, team1_goals, team2_goals):
+        """
+        Add a new match to the history, in O(1).
+
+        Parameters:
+            game_number (int): The game's number.
+            team1 (str): Name of the first team.
+            team2 (str): Name of the second team.
+            team1_goals (int): Goals (or score value) of the first team.
+            team2_goals (int): Goals (or score value) of the second team.
+        """
+        if self.size % CHUNK_SIZE == 0:
+            self.__chunks.append([array('i') for _ in COLUMNS])
+            self.__chunk_firsts.append(game_number)
+        if self.__last_game is not None and game_number < self.__last_game:
+            self.__ordered = False
+        self.__last_game = game_number
+
+        a = self.team_id(team1)
+        b = self.team_id(team2)
+        numbers, ids1, ids2, goals1, goals2 = self.__chunks[-1]
+        numbers.append(game_number)
+        ids1.append(a)
+        ids2.append(b)
+        goals1.append(team1_goals)
+        goals2.append(team2_goals)
+        self.__team_positions[a].append(self.size)
+        if b != a:
+            self.__team_positions[b].append(self.size)
+        if self.__pair_slots is not None:
+            self.__add_to_pair(a, b, team1_goals, team2_goals)
+        self.size += 1
+
+    def __add_to_pair(self, a, b, goals_a, goals_b):
+        """Adds one result to the running totals of the pair a, b."""
+        if b < a:
+            a, b, goals_a, goals_b = b, a, goals_b, goals_a
+        key = a << 32 | b
+        slot = self.__pair_slots.get(key)
+        totals = self.__pair_totals
+        if slot is None:
+            slot = self.__pair_slots[key] = len(totals)
+            totals.extend(array('q', bytes(8 * PAIR_FIELDS)))
+        if goals_a > goals_b:
+            totals[slot] += 1
+        elif goals_b > goals_a:
+            totals[slot + 1] += 1
+        else:
+            totals[slot + 2] += 1
+        totals[slot + 3] += goals_a
+        totals[slot + 4] += goals_b
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Iterates over the matches as Match tuples, oldest first, without building a list."""
+        names = self.names
+        for numbers, ids1, ids2, goals1, goals2 in self.__chunks:
+            for number, a, b, ga, gb in zip(numbers, ids1, ids2, goals1, goals2):
+                yield Match(number, names[a], names[b], ga, gb)
+
+    def __reversed__(self):
+        """Iterates over the matches as Match tuples, newest first."""
+        for position in range(self.size - 1, -1, -1):
+            yield self.__record(position)
+
+    def __record(self, position):
+        """Returns the match at a valid, non-negative position as a Match."""
+        chunk = self.__chunks[position // CHUNK_SIZE]
+        i = position % CHUNK_SIZE
+        names = self.names
+        return Match(chunk[0][i], names[chunk[1][i]], names[chunk[2][i]], chunk[3][i], chunk[4][i])
+
+    def matches(self, start=0, stop=None, team=None):
+        """
+        Iterates over the matches at positions start..stop-1 as Match tuples, oldest first,
+        optionally only those in which team played. With a team only that team's matches are
+        visited (a binary search in its positions), not the whole range.
+
+        Raises:
+            ValueError: If start or stop is negative (use last(k) for the most recent matches).
+        """
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("start and stop cannot be negative; use last(k) for the most recent matches.")
+        if team is None:
+            return islice(self, start, stop)
+        positions = self.team_positions(team)
+        stop = self.size if stop is None else stop
+        chosen = positions[bisect_left(positions, start):bisect_left(positions, stop)]
+        return (self.__record(position) for position in chosen)
+
+    def last(self, k):
+        """Iterates over the last k matches as Match tuples, oldest first, in O(k)."""
+        for position in range(max(self.size - max(k, 0), 0), self.size):
+            yield self.__record(position)
+
+    def match(self, position):
+        """
+        Returns one match as a dictionary, in the same form as MatchHistoryNode data.
+
+        Parameters:
+            position (int): 0-based position in the order matches were added (negative counts from the end).
+
+        Raises:
+            IndexError: If there is no match at that position.
+        """
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("match history position out of range")
+        chunk = self.__chunks[position // CHUNK_SIZE]
+        i = position % CHUNK_SIZE
+        return {
+            "game_number": chunk[0][i],
+            "team1": self.names[chunk[1][i]],
+            "team2": self.names[chunk[2][i]],
+            "team1_goals": chunk[3][i],
+            "team2_goals": chunk[4][i],
+        }
+
+    def __getitem__(self, position):
+        """Returns a match by position, or a list of matches for a slice of positions."""
+        if isinstance(position, slice):
+            return [self.match(i) for i in range(*position.indices(self.size))]
+        return self.match(position)
+
+    def column(self, name, start=0, stop=None):
+        """
+        Returns positions start..stop-1 of one column as a new array('i').
+
+        Parameters:
+            name (str): One of COLUMNS. team1 and team2 are team ids (see names).
+            start (int, optional): First position. Defaults to 0.
+            stop (int, optional): Position after the last one. Defaults to the end.
+        """
+        k = COLUMNS.index(name)
+        stop = self.size if stop is None else min(stop, self.size)
+        result = array('i')
+        while start < stop:
+            chunk_start = start - start % CHUNK_SIZE
+            chunk_stop = min(stop, chunk_start + CHUNK_SIZE)
+            result.extend(self.__chunks[start // CHUNK_SIZE][k][start - chunk_start:chunk_stop - chunk_start])
+            start = chunk_stop
+        return result
+
+    def positions(self, first_game, last_game):
+        """
+        Returns the positions of the matches numbered first_game..last_game (inclusive).
+
+        While game numbers have only gone up (as the tournament numbers them) this is a
+        binary search over the chunks and then within one; otherwise every match is checked.
+
+        Returns:
+            range or list: Positions in the order the matches were added.
+        """
+        if not self.__ordered:
+            numbers = self.column("game_number")
+            return [i for i, number in enumerate(numbers) if first_game <= number <= last_game]
+        return range(self.__bisect(first_game, bisect_left), self.__bisect(last_game, bisect_right))
+
+    def __bisect(self, game_number, bisect):
+        """Finds a position for game_number across the chunks with bisect_left or bisect_right."""
+        c = bisect(self.__chunk_firsts, game_number) - 1 # the chunk the position falls in
+        if c < 0:
+            return 0
+        return c * CHUNK_SIZE + bisect(self.__chunks[c][0], game_number)
+
+    def games(self, first_game, last_game):
+        """Returns the matches numbered first_game..last_game (inclusive) as dictionaries."""
+        return [self.match(i) for i in self.positions(first_game, last_game)]
+
+    def team_positions(self, team_name):
+        """Returns the positions of a team's matches, oldest first (empty for an unknown team)."""
+        team_id = self.ids.get(team_name)
+        if team_id is None:
+            return array('i')
+        return self.__team_positions[team_id]
+
+    def team_games(self, team_name):
+        """Returns all of a team's matches as dictionaries, oldest first."""
+        return [self.match(i) for i in self.team_positions(team_name)]
+
+    def last_results(self, team_name, k):
+        """
+        Returns a team's last k matches as dictionaries, oldest first, in O(k).
+
+        Parameters:
+            team_name (str): The team.
+            k (int): How many matches to return at most.
+        """
+        positions = self.team_positions(team_name)
+        return [self.match(i) for i in positions[max(len(positions) - k, 0):]]
+
+    def form(self, team_name, k=5):
+        """
+        Returns a team's last k results as a string of W, D and L, oldest first (e.g. "WWDLW").
+        Results are judged from the recorded goals.
+        """
+        form = []
+        for match in self.last_results(team_name, k):
+            if match["team1"] == team_name:
+                own, other = match["team1_goals"], match["team2_goals"]
+            else:
+                own, other = match["team2_goals"], match["team1_goals"]
+            form.append("W" if own > other else "L" if own < other else "D")
+        return "".join(form)
+
+    def __pair_positions(self, team1, team2):
+        """
+        Returns the positions of the matches between two teams, oldest first, by walking the
+        positions of whichever team played fewer matches.
+        """
+        a = self.ids.get(team1)
+        b = self.ids.get(team2)
+        if a is None or b is None:
+            return []
+        positions = self.__team_positions[a]
+        other = b
+        if len(self.__team_positions[b]) < len(positions):
+            positions, other = self.__team_positions[b], a
+        chunks = self.__chunks
+        pair = []
+        for position in positions:
+            chunk = chunks[position // CHUNK_SIZE]
+            i = position % CHUNK_SIZE
+            if (chunk[1][i] == other or chunk[2][i] == other) and (a != b or chunk[1][i] == chunk[2][i]):
+                pair.append(position)
+        return pair
+
+    def head_to_head(self, team1, team2):
+        """
+        Returns the head-to-head record of two teams, from team1's point of view, in O(1).
+        The first call builds the pair totals in one pass over the history.
+
+        Returns:
+            dict: games, team1_wins, team2_wins, draws, team1_goals and team2_goals.
+        """
+        if self.__pair_slots is None:
+            self.__pair_slots = {}
+            for numbers, ids1, ids2, goals1, goals2 in self.__chunks:
+                for a, b, ga, gb in zip(ids1, ids2, goals1, goals2):
+                    self.__add_to_pair(a, b, ga, gb)
+
+        wins_a = wins_b = draws = goals_a = goals_b = 0
+        a = self.ids.get(team1)
+        b = self.ids.get(team2)
+        if a is not None and b is not None:
+            slot = self.__pair_slots.get(min(a, b) << 32 | max(a, b))
+            if slot is not None:
+                wins_a, wins_b, draws, goals_a, goals_b = self.__pair_totals[slot:slot + PAIR_FIELDS]
+                if b < a:
+                    wins_a, wins_b, goals_a, goals_b = wins_b, wins_a, goals_b, goals_a
+        return {"games": wins_a + wins_b + draws, "team1_wins": wins_a, "team2_wins": wins_b,
+                "draws": draws, "team1_goals": goals_a, "team2_goals": goals_b}
+
+    def head_to_head_games(self, team1, team2, k=None):
+        """Returns the matches between two teams as dictionaries, oldest first (only the last k if given)."""
+        positions = self.__pair_positions(team1, team2)
+        if k is not None:
+            positions = positions[max(len(positions) - k, 0):]
+        return [self.match(i) for i in positions]
+
+    def format_history(self, matches=None):
+        """
+        Returns the lines for the given matches (default: all of them) as one string.
+        All matches are formatted straight from the columns, without building a Match each.
+        """
+        if matches is not None:
+            return "".join(match.format() + "\n" for match in matches)
+        names = self.names
+        columns = [self.column(name) for name in COLUMNS]
+        return "".join(f"Game {number}: {names[a]} {ga} - {gb} {names[b]}\n"
+                       for number, a, b, ga, gb in zip(*columns))
+
+    def display_history(self, matches=None):
+        """
+        Prints the matches in one write.
+
+        Parameters:
+            matches (iterable, optional): Matches to show, e.g. self.last(20). Defaults to all.
+        """
+        sys.stdout.write(self.format_history(matches))
+
+    def to_csv(self, file_name):
+        """
+        Writes the history to a CSV file with a header row. Names are quoted by csv.writer
+        when they need it (e.g. "Bosnia, Herz"), so csv.reader reads every row back as five fields.
+        """
+        names = self.names
+        columns = [self.column(name) for name in COLUMNS]
+        with open(file_name, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows((number, names[a], names[b], ga, gb) for number, a, b, ga, gb in zip(*columns))
+
+    def to_bytes(self):
+        """Returns the history in its binary form."""
+        encoded = [name.encode("utf-8") for name in self.names]
+        names = b''.join(NAME_LENGTH.pack(len(name)) + name for name in encoded)
+        parts = [HEADER.pack(MAGIC, VERSION, self.size, len(self.names), len(names)), names]
+        parts.extend(_little_endian(self.column(name)) for name in COLUMNS)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Reads a history from its binary form.
+
+        Raises:
+            ValueError: If the data is not a match history of a supported version.
+        """
+        try:
+            magic, version, count, num_names, names_length = HEADER.unpack_from(data, 0)
+        except struct.error as e:
+            raise ValueError(f"Truncated match history: {e}")
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a match history, or a history from an unsupported version.")
+        offset = HEADER.size
+        names_end = offset + names_length
+        if names_end > len(data):
+            raise ValueError("Truncated match history.")
+        names = []
+        while offset < names_end:
+            if offset + NAME_LENGTH.size > names_end:
+                raise ValueError("Truncated match history.")
+            (length,) = NAME_LENGTH.unpack_from(data, offset)
+            offset += NAME_LENGTH.size
+            names.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        if offset != names_end or len(names) != num_names or len(data) != offset + 4 * count * len(COLUMNS):
+            raise ValueError("Truncated match history.")
+
+        columns = []
+        for _ in COLUMNS:
+            column = array('i')
+            column.frombytes(data[offset:offset + 4 * count])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            columns.append(column)
+            offset += 4 * count
+
+        history = cls()
+        for name in names:
+            history.team_id(name)
+        for number, a, b, ga, gb in zip(*columns):
+            history.add_match(number, names[a], names[b], ga, gb)
+        return history
+
+    def save(self, file_name):
+        """Writes the history to a binary file in one write."""
+        with open(file_name, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, file_name):
+        """Reads a history from a binary file."""
+        with open(file_name, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def memory_bytes(self):
+        """Returns the bytes used by the columns (not counting team names)."""
+        return sum(column.itemsize * len(column) for chunk in self.__chunks for column in chunk)
+
+
+def main():
+    from linkedlist import MatchHistoryLinkedList
+
+    parser = argparse.ArgumentParser(description="Compare MatchHistory with MatchHistoryLinkedList.")
+    parser.add_argument("--matches", type=int, default=1000000)
+    parser.add_argument("--workload", choices=["random", "round-robin"], default="random",
+                        help="random pairs of 64 teams, or one big round robin (every match a new pair)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.workload == "random":
+        teams = [f"Team{i}" for i in range(64)]
+        pairs = ((rng.choice(teams), rng.choice(teams)) for _ in range(args.matches))
+    else:
+        num_teams = int((2 * args.matches) ** 0.5) + 2
+        teams = [f"Team{i}" for i in range(num_teams)]
+        pairs = ((teams[i], teams[j]) for i in range(num_teams) for j in range(i + 1, num_teams))
+    matches = [(i + 1, team1, team2, rng.randint(0, 5), rng.randint(0, 5))
+               for i, (team1, team2) in zip(range(args.matches), pairs)]
+
+    for store in (MatchHistoryLinkedList, MatchHistory):
+        tracemalloc.start()
+        start = time.perf_counter()
+        history = store()
+        for match in matches:
+            history.add_match(*match)
+        elapsed = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{store.__name__:<24} {args.matches:>10,} matches: {elapsed:6.2f} s, "
+              f"{used / 2 ** 20:8.1f} MB ({used / max(args.matches, 1):.0f} bytes/match)")
+
+        # "Team0 against Team1" by walking the list, or from the pair totals
+        if store is MatchHistory:
+            # The first head_to_head builds the pair totals in one pass over the history
+            start = time.perf_counter()
+            history.head_to_head("Team0", "Team2")
+            print(f"{'':<24} pair totals built on first query: {time.perf_counter() - start:6.2f} s")
+        start = time.perf_counter()
+        if store is MatchHistoryLinkedList:
+            games = 0
+            current = history.head
+            while current:
+                match = current.get_data()
+                games += {match["team1"], match["team2"]} == {"Team0", "Team1"}
+                current = current.get_next()
+        else:
+            games = history.head_to_head("Team0", "Team1")["games"]
+            history.last_results("Team0", 20)
+            history.form("Team0")
+        print(f"{'':<24} head-to-head ({games} games): {(time.perf_counter() - start) * 1000:.3f} ms")
+        del history
+
+
+if __name__ == "__main__":
+    main()
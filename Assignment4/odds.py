@@ -0,0 +1,203 @@
+"""
+Monte Carlo championship odds for the World Cup simulation.
+
+Runs many full tournaments without any input or printing (group stage,
+setup_knockout_round, knockout) and counts, for every team, how often it
+qualified from its group and how often it won the title. Tournaments are
+split into shards across a process pool. Every tournament is seeded from
+(master_seed, tournament index), so the totals for a master seed are the same
+for any number of workers.
+
+The knockout is played like play_knockout_round, round by round on a Bracket:
+first against second, third against fourth, and so on until one team is left.
+
+Usage:
+    python odds.py [--tournaments 100000] [--seed 0] [--workers N] [--csv teams.csv]
+"""
+import argparse
+import io
+import os
+import random
+import time
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+
+from bracket import Bracket
+from groupengine import group_ids, simulate_group_stage
+from linkedlist import LinkedListt
+from teamtable import TeamTable
+from worldcup import initialize_teams, knockout_match_play, setup_knockout_round
+
+SHARD_SIZE = 2000 # tournaments per task
+TOURNAMENT_STRIDE = 2 ** 32 # tournament seeds are master_seed * TOURNAMENT_STRIDE + index
+
+
+def tournament_seed(master_seed, index):
+    """Returns the seed of one tournament."""
+    return master_seed * TOURNAMENT_STRIDE + index
+
+
+class Field:
+    """
+    The teams of a tournament, loaded once and reset before every tournament.
+
+    Attributes:
+        table (TeamTable): Team names, powers and results.
+        group_ids (list): One array of team ids per group, in CSV order.
+    """
+
+    def __init__(self, csv_file):
+        self.table = TeamTable()
+        with redirect_stdout(io.StringIO()): # initialize_teams reports problems by printing
+            all_teams, groups = initialize_teams(csv_file, self.table)
+        if not groups:
+            raise ValueError(f"Could not load any teams from '{csv_file}'.")
+        self.group_ids = [group_ids(group) for group in groups]
+
+    def fresh_groups(self):
+        """Clears all results and returns new group linked lists in CSV order."""
+        self.table.reset_results()
+        groups = []
+        for ids in self.group_ids:
+            group = LinkedListt(indexed=True)
+            for team_id in ids:
+                group.append_team(self.table.view(team_id))
+            groups.append(group)
+        return groups
+
+
+def play_tournament(field, rng):
+    """
+    Plays one full tournament without any I/O.
+
+    Returns:
+        tuple: Ids of the teams that qualified from the groups, and the champion's id.
+    """
+    groups = simulate_group_stage(field.table, field.fresh_groups(), None, rng)
+    knockout_list = setup_knockout_round(groups)
+
+    bracket = Bracket.from_list(knockout_list)
+    qualified = [team.id for team in bracket.teams]
+    champion = bracket.play(knockout_match_play, rng)
+    return qualified, champion.id
+
+
+class OddsResult:
+    """
+    Counts over many tournaments.
+
+    Attributes:
+        tournaments (int): Number of tournaments played.
+        names (list): Team name by team id.
+        qualified (list): Times each team qualified from its group, by team id.
+        titles (list): Times each team won the tournament, by team id.
+    """
+
+    def __init__(self, names):
+        self.tournaments = 0
+        self.names = list(names)
+        self.qualified = [0] * len(names)
+        self.titles = [0] * len(names)
+
+    def merge(self, other):
+        """Adds the counts of another result into this one and returns self."""
+        self.tournaments += other.tournaments
+        self.qualified = [a + b for a, b in zip(self.qualified, other.qualified)]
+        self.titles = [a + b for a, b in zip(self.titles, other.titles)]
+        return self
+
+    def probabilities(self):
+        """
+        Returns (team name, probability of qualifying, probability of the title) for every team,
+        by team id (a list, since teams in different groups may share a name).
+        """
+        n = self.tournaments or 1
+        return [(name, self.qualified[i] / n, self.titles[i] / n) for i, name in enumerate(self.names)]
+
+    def __eq__(self, other):
+        return (isinstance(other, OddsResult) and self.tournaments == other.tournaments
+                and self.names == other.names and self.qualified == other.qualified
+                and self.titles == other.titles)
+
+    def __str__(self):
+        lines = [f"Tournaments: {self.tournaments}",
+                 f"| {'Team':<14} | {'Qualify':>8} | {'Title':>8} |"]
+        for name, qualify, title in sorted(self.probabilities(), key=lambda odds: odds[2], reverse=True):
+            lines.append(f"| {name:<14} | {qualify:>8.2%} | {title:>8.2%} |")
+        return "\n".join(lines)
+
+
+def simulate_tournaments(num_tournaments, csv_file='teams.csv', master_seed=0, start=0):
+    """
+    Plays num_tournaments seeded tournaments in this process.
+
+    Returns:
+        OddsResult: Qualification and title counts per team.
+    """
+    field = Field(csv_file)
+    result = OddsResult(field.table.names)
+    rng = random.Random()
+    for index in range(start, start + num_tournaments):
+        rng.seed(tournament_seed(master_seed, index))
+        qualified, champion = play_tournament(field, rng)
+        result.tournaments += 1
+        for team_id in qualified:
+            result.qualified[team_id] += 1
+        result.titles[champion] += 1
+    return result
+
+
+def _play_shard(args):
+    """Worker entry point: plays one shard of tournaments."""
+    return simulate_tournaments(*args)
+
+
+def run_parallel(num_tournaments, csv_file='teams.csv', master_seed=0, workers=None, shard_size=SHARD_SIZE):
+    """
+    Plays num_tournaments seeded tournaments across a pool of worker processes.
+
+    Parameters:
+        num_tournaments (int): Number of tournaments to play.
+        csv_file (str): The teams CSV file.
+        master_seed (int): Seed the per tournament seeds are derived from.
+        workers (int, optional): Number of processes. Defaults to os.cpu_count().
+        shard_size (int): Number of tournaments handed to a worker at a time.
+
+    Returns:
+        OddsResult: Merged qualification and title counts.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    shards = [(min(shard_size, num_tournaments - start), csv_file, master_seed, start)
+              for start in range(0, num_tournaments, shard_size)]
+
+    result = OddsResult(Field(csv_file).table.names)
+    if workers == 1:
+        for shard in shards:
+            result.merge(_play_shard(shard))
+        return result
+
+    with Pool(workers) as pool:
+        for shard_result in pool.imap(_play_shard, shards):
+            result.merge(shard_result)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate qualification and title odds for every team.")
+    parser.add_argument("--tournaments", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--csv", default="teams.csv")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = run_parallel(args.tournaments, args.csv, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(result)
+    print(f"{args.tournaments / elapsed:,.0f} tournaments/second ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
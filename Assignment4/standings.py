@@ -0,0 +1,127 @@
+from bisect import bisect_left, insort
+
+
+def standings_key(team):
+    """
+    The ranking order used throughout the tournament: points, then goal difference, then power.
+    """
+    return (team["points"], team["GD"], team["power"])
+
+
+class Standings:
+    """
+    Live, ordered standings for one group (a LinkedListt).
+
+    Teams are kept in a sorted Python list of entries (ranking, seq, node), best team first.
+    ranking is the negated key, so an ascending list puts the highest key first, and seq is
+    the team's position in the group when the standings were built, which breaks ties
+    exactly like a stable sort of the group would. After a match only the two teams
+    involved are moved: each is found and re-inserted with bisect, so a result costs
+    O(log n) comparisons instead of a full O(n log n) re-sort, and top(k) is O(k).
+
+    The standings follow changes to team data (through update), not teams being added to
+    or deleted from the group, so build them once the group's teams are known. A group keeps
+    its standings between matchdays (LinkedListt.get_standings), so they are only built once.
+
+    Attributes:
+        group (LinkedListt): The group the standings belong to.
+    """
+
+    def __init__(self, group, key=standings_key):
+        """
+        Builds the standings from the group's current order.
+
+        Parameters:
+            group (LinkedListt): The group of teams.
+            key (function, optional): Returns a tuple of numbers to rank a team dictionary by,
+                                      higher first. Defaults to standings_key.
+        """
+        self.group = group
+        self.__key = key
+        self.__entries = []
+        self.__current = {} # team name -> its entry in self.__entries
+
+        current = group.head
+        seq = 0
+        while current:
+            entry = (self.__ranking(current.get_data()), seq, current)
+            self.__entries.append(entry)
+            self.__current[current.get_data()["name"]] = entry
+            seq += 1
+            current = current.get_next()
+        self.__entries.sort() # seq is unique, so the nodes themselves are never compared
+
+    def __ranking(self, team):
+        return tuple(-value for value in self.__key(team))
+
+    def update(self, team_name):
+        """
+        Moves a team to its new place after its data changed.
+
+        Parameters:
+            team_name (str): The name of the team whose points, GD or power changed.
+        """
+        old = self.__current.get(team_name)
+        if old is None:
+            return
+        ranking, seq, node = old
+        new_ranking = self.__ranking(node.get_data())
+        if new_ranking == ranking:
+            return
+
+        del self.__entries[bisect_left(self.__entries, (ranking, seq))]
+        new = (new_ranking, seq, node)
+        insort(self.__entries, new)
+        self.__current[team_name] = new
+
+    def top(self, k):
+        """
+        Returns the data of the k best teams, best first, in O(k).
+
+        Parameters:
+            k (int): How many teams to return.
+        """
+        return [node.get_data() for _, _, node in self.__entries[:k]]
+
+    def rank(self, team_name):
+        """
+        Returns a team's 1-based position in the standings, or None if it is not in the group.
+        """
+        entry = self.__current.get(team_name)
+        if entry is None:
+            return None
+        return bisect_left(self.__entries, entry[:2]) + 1
+
+    def __iter__(self):
+        """Iterates over the team data from first place to last."""
+        for _, _, node in self.__entries:
+            yield node.get_data()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def relink(self):
+        """
+        Puts the group's linked list in standings order in one O(n) pass,
+        giving the same order as group.sort(key=..., reverse=True) would.
+        The tie-breaking positions are renumbered in the new order, so later updates break
+        ties like a stable sort of the relinked group.
+        """
+        group = self.group
+        entries = []
+        previous = None
+        for seq, (ranking, _, node) in enumerate(self.__entries):
+            entry = (ranking, seq, node)
+            entries.append(entry)
+            self.__current[node.get_data()["name"]] = entry
+            if previous is None:
+                group.head = node
+            else:
+                previous.set_next(node)
+            if group.prev_index is not None:
+                group.prev_index[node.get_data()["name"]] = previous
+            previous = node
+        if previous is not None:
+            previous.set_next(None)
+        group.tail = previous
+        self.__entries = entries
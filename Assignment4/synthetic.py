@@ -0,0 +1,74 @@
+"""
+Seeded synthetic team files for testing the simulation at scale.
+
+Writes a Group,Team,Power CSV in the same layout as teams.csv with any number
+of groups and teams per group. The same arguments always give the same file.
+Rows are written one group at a time, so files with millions of teams are
+written in bounded memory.
+
+Usage:
+    python synthetic.py OUTPUT --groups 8 --teams-per-group 4 [--seed 0] [--max-power 5]
+"""
+import argparse
+import random
+
+
+def group_name(index):
+    """Returns the name of a group: A..Z for the first 26 groups, then G27, G28, ..."""
+    return chr(65 + index) if index < 26 else f"G{index + 1}"
+
+
+def generate_teams(csv_file, groups, teams_per_group, seed=0, min_power=1, max_power=5):
+    """
+    Writes a synthetic team file.
+
+    Parameters:
+        csv_file (str): Path of the file to write.
+        groups (int): Number of groups.
+        teams_per_group (int): Number of teams in each group.
+        seed (int, optional): Seed for the team powers.
+        min_power (int, optional): Lowest power. Defaults to 1.
+        max_power (int, optional): Highest power. Defaults to 5, like teams.csv.
+
+    Returns:
+        int: The number of teams written.
+
+    Raises:
+        ValueError: If a count is negative or the power range is invalid.
+    """
+    if groups < 0 or teams_per_group < 0:
+        raise ValueError("The number of groups and teams per group cannot be negative.")
+    if not 0 <= min_power <= max_power:
+        raise ValueError("Powers must satisfy 0 <= min_power <= max_power.")
+
+    rng = random.Random(seed)
+    team_number = 0
+    with open(csv_file, 'w') as file:
+        file.write("Group,Team,Power\n")
+        for g in range(groups):
+            name = group_name(g)
+            rows = []
+            for _ in range(teams_per_group):
+                team_number += 1
+                rows.append(f"{name},Team{team_number},{rng.randint(min_power, max_power)}\n")
+            file.writelines(rows)
+    return team_number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a seeded synthetic team CSV file.")
+    parser.add_argument("output")
+    parser.add_argument("--groups", type=int, default=8)
+    parser.add_argument("--teams-per-group", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-power", type=int, default=1)
+    parser.add_argument("--max-power", type=int, default=5)
+    args = parser.parse_args()
+
+    teams = generate_teams(args.output, args.groups, args.teams_per_group, args.seed,
+                           args.min_power, args.max_power)
+    print(f"Wrote {teams:,} teams in {args.groups:,} groups to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Streaming, validating loader for team CSV files (Group,Team,Power).
+
+The file is read one row at a time with the csv module, so memory depends on
+the number of teams kept, not on the size of the file. Group and team names
+are interned, powers are checked, and every team goes straight into a
+TeamTable and its group's linked list in the same pass.
+
+Usage:
+    python teamloader.py [CSV_FILE]
+"""
+import argparse
+import csv
+import sys
+import time
+
+from linkedlist import LinkedListt
+from teamtable import MAX_POWER, TeamTable
+
+
+class LoadStats:
+    """
+    What a load read.
+
+    Attributes:
+        rows (int): Data rows read (not counting the header).
+        teams (int): Teams loaded.
+        groups (int): Groups found.
+        skipped (int): Rows skipped because they did not have three fields.
+        seconds (float): Time the load took.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.teams = 0
+        self.groups = 0
+        self.skipped = 0
+        self.seconds = 0.0
+
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.rows:,} rows, {self.teams:,} teams in {self.groups:,} groups, "
+                f"{self.skipped:,} skipped, {self.seconds:.2f} s ({self.rows_per_second():,.0f} rows/second)")
+
+
+def parse_power(text, line_number):
+    """
+    Returns a power value read from the CSV.
+
+    Raises:
+        ValueError: If the power is not a whole number from 0 to MAX_POWER.
+    """
+    try:
+        power = int(text)
+    except ValueError:
+        raise ValueError(f"Line {line_number}: power '{text}' is not a whole number.")
+    if power < 0:
+        raise ValueError(f"Line {line_number}: power {power} cannot be negative.")
+    if power > MAX_POWER:
+        raise ValueError(f"Line {line_number}: power {power} is larger than the maximum of {MAX_POWER}.")
+    return power
+
+
+def read_team_rows(csv_file, stats=None, report=print):
+    """
+    Yields (group, team, power) for each row of a team CSV file, reading one row at a time.
+
+    Parameters:
+        csv_file (str): Path to the CSV file. The first line is a header and is skipped.
+        stats (LoadStats, optional): Counts rows and skipped rows here.
+        report (function, optional): Called with a message for every skipped row. Defaults to print.
+
+    Raises:
+        ValueError: If the file has no data rows or a power is invalid.
+    """
+    if stats is None:
+        stats = LoadStats()
+    intern = sys.intern
+    with open(csv_file, 'r', newline='') as file:
+        reader = csv.reader(file)
+        next(reader, None) # Skip the header line
+        for line_number, row in enumerate(reader, 2):
+            if not row:
+                continue # blank line
+            stats.rows += 1
+            if len(row) != 3:
+                stats.skipped += 1
+                report(f"Skipping malformed line: {','.join(row)}")
+                continue
+            group, team, power = row
+            yield intern(group), intern(team), parse_power(power, line_number)
+    if stats.rows == 0:
+        raise ValueError("CSV file is empty or does not contain enough data.")
+
+
+def load_teams(csv_file, table=None, stats=None, report=print):
+    """
+    Loads a team CSV file in a single pass.
+
+    Parameters:
+        csv_file (str): Path to the CSV file.
+        table (TeamTable, optional): The table to add the teams to. Defaults to a new one.
+        stats (LoadStats, optional): Filled in with counts and timing.
+        report (function, optional): Called with a message for every skipped row.
+
+    Returns:
+        list: A list of all team names.
+        list: A list of linked lists (one per group, in order of first appearance) of TeamViews.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file has no data, a power is invalid or a team name is repeated
+                    within a group (the same name in different groups is fine).
+    """
+    if table is None:
+        table = TeamTable()
+    if stats is None:
+        stats = LoadStats()
+    start = time.perf_counter()
+
+    all_teams = []
+    group_teams = {}
+    for group, team, power in read_team_rows(csv_file, stats, report):
+        all_teams.append(team)
+        group_list = group_teams.get(group)
+        if group_list is None:
+            group_list = group_teams[group] = LinkedListt(indexed=True)
+        if group_list.find(team) is not None: # names only have to be unique within a group
+            raise ValueError(f"Team '{team}' appears twice in group '{group}'.")
+        group_list.append_team(table.view(table.add_team(team, power)))
+
+    stats.teams = len(all_teams)
+    stats.groups = len(group_teams)
+    stats.seconds = time.perf_counter() - start
+    return all_teams, list(group_teams.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a team CSV file and report how fast it was read.")
+    parser.add_argument("csv_file", nargs="?", default="teams.csv")
+    args = parser.parse_args()
+
+    stats = LoadStats()
+    table = TeamTable()
+    load_teams(args.csv_file, table, stats)
+    print(stats)
+    print(f"Team statistics: {table.memory_bytes() / 2 ** 20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+from array import array
+import sys
+
+STAT_FIELDS = ("power", "points", "wins", "losses", "draws", "GD")
+FIELDS = ("name",) + STAT_FIELDS
+TYPECODES = {"GD": 'q'} # GD is a running sum of goal margins, so it gets 64 bits; the rest fit in 32
+MAX_POWER = 2 ** 31 - 1 # goals are drawn up to a team's power and stored as int32 here and in MatchHistory
+
+
+class TeamTable:
+    """
+    Column store for team data: one array per statistic, addressed by team id.
+
+    A team costs 4 bytes per column and 8 for GD (28 bytes) plus its name, instead of a
+    seven-key dictionary. Teams get ids 0, 1, 2, ... in the order they are added.
+
+    Attributes:
+        names (list): Team name by id.
+        columns (dict): Field name -> array of that statistic by id ('i', or 'q' for GD).
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty team table.
+        """
+        self.names = []
+        self.ids = {} # team name -> id of the first team added with that name
+        self.columns = {field: array(TYPECODES.get(field, 'i')) for field in STAT_FIELDS}
+        self.power = self.columns["power"]
+        self.points = self.columns["points"]
+        self.wins = self.columns["wins"]
+        self.losses = self.columns["losses"]
+        self.draws = self.columns["draws"]
+        self.GD = self.columns["GD"]
+
+    def add_team(self, name, power):
+        """
+        Adds a team with no results yet. Every call adds a new row, so the same name can
+        be added more than once (e.g. two clubs called Nacional in different leagues);
+        keeping names unique within a group is up to the group's list.
+
+        Parameters:
+            name (str): The team name (interned, so repeated names share one string).
+            power (int): The team's power, 0 to MAX_POWER.
+
+        Returns:
+            int: The new team's id.
+
+        Raises:
+            ValueError: If the power is out of range.
+        """
+        if not 0 <= power <= MAX_POWER:
+            raise ValueError(f"Power {power} is out of range (0 to {MAX_POWER}).")
+        name = sys.intern(name)
+        team_id = len(self.names)
+        self.names.append(name)
+        self.ids.setdefault(name, team_id)
+        self.power.append(power)
+        for field in STAT_FIELDS[1:]:
+            self.columns[field].append(0)
+        return team_id
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, name):
+        """
+        Returns the id of a team by name, or None if it is not in the table.
+        If several teams share the name, this is the first one added.
+        """
+        return self.ids.get(name)
+
+    def view(self, team_id):
+        """Returns a dictionary-like TeamView of one team."""
+        return TeamView(self, team_id)
+
+    def as_dict(self, team_id):
+        """Returns one team as the plain dictionary the rest of the simulation uses."""
+        team = {"name": self.names[team_id]}
+        for field in STAT_FIELDS:
+            team[field] = self.columns[field][team_id]
+        return team
+
+    def record_result(self, team1_id, team2_id, team1_goals, team2_goals):
+        """
+        Applies one match result to both teams, writing straight into the columns.
+
+        Parameters:
+            team1_id (int): Id of the first team.
+            team2_id (int): Id of the second team.
+            team1_goals (int): Goals scored by the first team.
+            team2_goals (int): Goals scored by the second team.
+        """
+        if team1_goals > team2_goals:
+            self.points[team1_id] += 3
+            self.wins[team1_id] += 1
+            self.losses[team2_id] += 1
+        elif team2_goals > team1_goals:
+            self.points[team2_id] += 3
+            self.wins[team2_id] += 1
+            self.losses[team1_id] += 1
+        else:
+            self.points[team1_id] += 1
+            self.points[team2_id] += 1
+            self.draws[team1_id] += 1
+            self.draws[team2_id] += 1
+        self.GD[team1_id] += team1_goals - team2_goals
+        self.GD[team2_id] += team2_goals - team1_goals
+
+    def record_results(self, team1_ids, team2_ids, team1_goals, team2_goals):
+        """
+        Applies a batch of match results (e.g. a matchday) in one pass over the batch.
+        Each result is O(1): the teams are addressed by id and nothing is looked up or copied.
+
+        Parameters:
+            team1_ids (sequence): Id of the first team of each match.
+            team2_ids (sequence): Id of the second team of each match.
+            team1_goals (sequence): Goals scored by the first team of each match.
+            team2_goals (sequence): Goals scored by the second team of each match.
+        """
+        points, wins, losses, draws, gd = self.points, self.wins, self.losses, self.draws, self.GD
+        for a, b, ga, gb in zip(team1_ids, team2_ids, team1_goals, team2_goals):
+            if ga > gb:
+                points[a] += 3
+                wins[a] += 1
+                losses[b] += 1
+            elif gb > ga:
+                points[b] += 3
+                wins[b] += 1
+                losses[a] += 1
+            else:
+                points[a] += 1
+                points[b] += 1
+                draws[a] += 1
+                draws[b] += 1
+            gd[a] += ga - gb
+            gd[b] += gb - ga
+
+    def reset_results(self):
+        """
+        Sets every team's points, wins, losses, draws and GD back to 0, keeping names and power.
+        The columns are cleared in place, so views and references to them stay valid.
+        """
+        for field in STAT_FIELDS[1:]:
+            column = self.columns[field]
+            column[:] = array(column.typecode, [0]) * len(self.names)
+
+    def memory_bytes(self):
+        """Returns the bytes used by the statistic columns (not counting names)."""
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
+
+class TeamView:
+    """
+    A team in a TeamTable that reads and writes like the team dictionaries used elsewhere
+    (team["points"] += 3, team.copy(), team.get("GD")), so it can be stored in linked list
+    nodes without changing the code that uses them. Nothing is copied: every read and
+    write goes to the table's columns.
+    """
+
+    __slots__ = ("table", "id")
+
+    def __init__(self, table, team_id):
+        self.table = table
+        self.id = team_id
+
+    def __getitem__(self, field):
+        if field == "name":
+            return self.table.names[self.id]
+        return self.table.columns[field][self.id]
+
+    def __setitem__(self, field, value):
+        if field == "name":
+            raise KeyError("A team's name cannot be changed through its view.")
+        self.table.columns[field][self.id] = value
+
+    def __contains__(self, field):
+        return field in FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, TeamView):
+            return self.table is other.table and self.id == other.id
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self.table), self.id))
+
+    def get(self, field, default=None):
+        return self[field] if field in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def items(self):
+        return [(field, self[field]) for field in FIELDS]
+
+    def copy(self):
+        """Returns a plain dictionary snapshot of the team."""
+        return self.table.as_dict(self.id)
+
+    def __repr__(self):
+        return repr(self.copy())
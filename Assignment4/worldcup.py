@@ -1,46 +1,28 @@
 import random
-from linkedlist import LinkedListNode, LinkedListt, MatchHistoryNode, MatchHistoryLinkedList
+import sys
+from bracket import Bracket
+from linkedlist import LinkedListNode, LinkedListt, MatchHistoryNode
+from matchhistory import MatchHistory
+from teamloader import load_teams
+from teamtable import TeamView
 
 
-def initialize_teams(csv_file):
+def initialize_teams(csv_file, table=None):
     """
     Read teams from a CSV file and return both a list of all teams and linked lists for each group.
+    Team data is stored in a TeamTable; the group nodes hold TeamViews of it, which read and
+    write like the usual team dictionaries. The file is streamed row by row by teamloader.
 
     Parameters:
         csv_file (str): Path to the CSV file.
+        table (TeamTable, optional): The table to add the teams to. Defaults to a new one.
 
     Returns:
         list: A list of all team names.
         list: A list of linked lists, where each linked list contains teams in a group.
     """
-    all_teams = []  #  list of all team names
-    Teams_in_group = []  # List to store linked lists for each group
     try:
-        with open(csv_file, 'r') as file:
-            lines = file.readlines()
-
-            if len(lines) < 2:
-                raise ValueError("CSV file is empty or does not contain enough data.")
-
-            group_teams = {}
-            for line in lines[1:]: # Skip the header line
-                parts = line.strip().split(',')
-                if len(parts) == 3:
-                    group, team, power = parts
-                    all_teams.append(team)
-
-                    if group not in group_teams:
-                        group_teams[group] = LinkedListt()
-
-                    team_data = {
-                        "name": team, "power": int(power), "points": 0,
-                        "wins": 0, "losses": 0, "draws": 0, "GD": 0
-                    }
-                    group_teams[group].append_team(team_data)
-                else:
-                    print(f"Skipping malformed line: {line.strip()}")
-
-            Teams_in_group.extend(group_teams.values())
+        return load_teams(csv_file, table)
 
     except FileNotFoundError:
         print(f"Error: File '{csv_file}' not found.")
@@ -49,18 +31,34 @@ def initialize_teams(csv_file):
         print(f"Error: {e}")
         return [], [] # Return empty lists on error
 
-    return all_teams, Teams_in_group
 
+def draw_match_goals(team1, team2):
+    """
+    Draws the goals of a group stage match, as used by simulate_match.
+
+    Returns:
+        tuple: Goals for team1 and team2.
+    """
+    # Use scaled goals to keep scores realistic
+    goal_range = max(1, abs(team1["power"] - team2["power"]) // 2)
+    return random.randint(0, goal_range), random.randint(0, goal_range)
+
+
+def draw_power_goals(team1, team2):
+    """
+    Draws the goals of a match day game, as used by group_match_play: up to each team's power.
+
+    Returns:
+        tuple: Goals for team1 and team2.
+    """
+    return random.randint(0, team1["power"]), random.randint(0, team2["power"])
 
 
 def simulate_match(team1, team2, match_history, game_number):
     """
     Simulates a match between two teams and updates the match history.
     """
-    # Use scaled goals to keep scores realistic
-    goal_range = max(1, abs(team1["power"] - team2["power"]) // 2)
-    team1_goals = random.randint(0, goal_range)
-    team2_goals = random.randint(0, goal_range)
+    team1_goals, team2_goals = draw_match_goals(team1, team2)
 
     # Determine match outcome
     if team1_goals > team2_goals:
@@ -100,8 +98,7 @@ def group_match_play(team1, team2):
     Returns:
         tuple: Updated data for both teams.
     """
-    team1_goals = random.randint(0, team1["power"])
-    team2_goals = random.randint(0, team2["power"])
+    team1_goals, team2_goals = draw_power_goals(team1, team2)
 
     if team1_goals > team2_goals:
         team1["points"] += 3
@@ -124,40 +121,80 @@ def group_match_play(team1, team2):
 
 
 
-def group_update_after_match(group, team1_name, team2_name, team1_goals, team2_goals):
-    current = group.head
-    while current:
+def group_update_after_match(group, team1_name, team2_name, team1_goals, team2_goals, standings=None):
+    """
+    Applies a match result to both teams in the group.
+    The teams are looked up by name, which is O(1) when the group has a name index.
+    Both teams are moved to their new places in the given Standings, or else in the
+    group's own live standings if it has them.
+    """
+    if standings is None:
+        standings = group.standings
+    for team_name, goals_for, goals_against in ((team1_name, team1_goals, team2_goals),
+                                                (team2_name, team2_goals, team1_goals)):
+        current = group.find(team_name)
+        if not current:
+            continue
         team = current.get_data()
-        if team["name"] == team1_name:
-            team["GD"] += (team1_goals - team2_goals)
-            if team1_goals > team2_goals:
-                team["points"] += 3
-                team["wins"] += 1
-            elif team1_goals == team2_goals:
-                team["points"] += 1
-                team["draws"] += 1
-            else:
-                team["losses"] += 1
-            current.set_data(team)
-        elif team["name"] == team2_name:
-            team["GD"] += (team2_goals - team1_goals)
-            if team2_goals > team1_goals:
-                team["points"] += 3
-                team["wins"] += 1
-            elif team1_goals == team2_goals:
-                team["points"] += 1
-                team["draws"] += 1
-            else:
-                team["losses"] += 1
-            current.set_data(team)
-        current = current.get_next()
+        team["GD"] += (goals_for - goals_against)
+        if goals_for > goals_against:
+            team["points"] += 3
+            team["wins"] += 1
+        elif goals_for == goals_against:
+            team["points"] += 1
+            team["draws"] += 1
+        else:
+            team["losses"] += 1
+        current.set_data(team)
+        if standings is not None:
+            standings.update(team_name)
+
+
+
+
+def apply_match_results(results, standings=None):
+    """
+    Applies a batch of match results (e.g. one matchday) in a single pass, without copying
+    or looking up any team. Each result costs O(1), whatever the size of the group.
 
+    Parameters:
+        results (list): (team1, team2, team1_goals, team2_goals) tuples, where the teams are the
+                        team data objects held by the group's nodes.
+        standings (Standings, optional): The group's live standings; the teams that played are
+                                         moved to their new places.
+    """
+    if not results:
+        return
+    if all(isinstance(team, TeamView) for result in results for team in result[:2]):
+        # Column fast path: add the results into the TeamTable by id
+        team1, team2, team1_goals, team2_goals = zip(*results)
+        team1[0].table.record_results([team.id for team in team1], [team.id for team in team2],
+                                      team1_goals, team2_goals)
+    else:
+        for team1, team2, team1_goals, team2_goals in results:
+            for team, goals_for, goals_against in ((team1, team1_goals, team2_goals),
+                                                   (team2, team2_goals, team1_goals)):
+                team["GD"] += (goals_for - goals_against)
+                if goals_for > goals_against:
+                    team["points"] += 3
+                    team["wins"] += 1
+                elif goals_for == goals_against:
+                    team["points"] += 1
+                    team["draws"] += 1
+                else:
+                    team["losses"] += 1
 
+    if standings is not None:
+        for team1, team2, _, _ in results:
+            standings.update(team1["name"])
+            standings.update(team2["name"])
 
 
 def group_stage_matches(groups, match_history):
     """
     Simulates group stage matches for all groups and tracks match history.
+    Each group's goals are drawn fixture by fixture, then its results are applied
+    in one batch with apply_match_results.
 
     Parameters:
         groups (list): A list of LinkedListt objects, each representing a group.
@@ -170,6 +207,7 @@ def group_stage_matches(groups, match_history):
     for group_index, group in enumerate(groups):
         #print(f"\nSimulating matches for Group {chr(65 + group_index)}:")
 
+        results = []
         current_node = group.head
         while current_node:
             opponent_node = current_node.get_next()
@@ -177,32 +215,34 @@ def group_stage_matches(groups, match_history):
                 team1_data = current_node.get_data()
                 team2_data = opponent_node.get_data()
 
-                # Simulate a match and update match history
-                updated_team1, updated_team2 = simulate_match(
-                    team1_data.copy(), team2_data.copy(), match_history, game_number
-                )
+                # Simulate a match (as simulate_match does) and update match history
+                team1_goals, team2_goals = draw_match_goals(team1_data, team2_data)
+                match_history.add_match(game_number, team1_data["name"], team2_data["name"],
+                                        team1_goals, team2_goals)
                 game_number += 1
-
-                # Update the group after the match
-                group_update_after_match(group, updated_team1["name"], updated_team2["name"], 
-                                         updated_team1["GD"], updated_team2["GD"])
+                results.append((team1_data, team2_data, team1_goals, team2_goals))
 
                 opponent_node = opponent_node.get_next()
             current_node = current_node.get_next()
 
-        # Sort group standings
-        group.sort(key=lambda x: (x["points"], x["GD"], x["power"]), reverse=True)
+        # Apply the group's results to its live standings, then put it in standings order
+        # (same order a stable sort by points, GD, power gives)
+        standings = group.get_standings()
+        apply_match_results(results, standings)
+        standings.relink()
 
     return groups
 
 
 
 def display_group_rankings(groups): 
-    """Displays rankings for all groups."""
-    for i, group in enumerate(groups):
-        group_name = chr(ord('A') + i) # Get group name (A, B, C, etc.)
-        print(f"\nRankings for Group {group_name}:")
-        group.display_rankings() # Call display_rankings on each group (LinkedListt)
+    """Displays rankings for all groups, in one write."""
+    LinkedListt.display_group_rankings(groups)
+
+
+def format_bracket(knockout_list):
+    """Returns the names of the teams left in the knockout, one per line, as one string."""
+    return "".join(f"{team['name']}\n" for team in knockout_list)
 
 
 
@@ -223,19 +263,13 @@ def promote_teams(groups):
     for group_index, group_list in enumerate(groups):
         print(f"\nProcessing Group {chr(65 + group_index)}")
 
-        # Sort the group by points, goal difference, then power (important!)
-        group_list.sort(key=lambda x: (x["points"], x["GD"], x["power"]), reverse=True) 
+        # Promote the top 2 teams by points, goal difference, then power (important!),
+        # read from the group's live standings in O(1)
+        top_two = group_list.get_standings().top(2)
+        qualified_teams.extend(team.copy() for team in top_two) # Append copies to avoid unintended modification
 
-        # Promote top 2 teams
-        current = group_list.head
-        for _ in range(2):
-            if current:
-                qualified_teams.append(current.get_data().copy()) # Append copy to avoid unintended modification
-                current = current.get_next()
-
-        # Remove the bottom two teams (correctly):
-        while group_list.size() > 2: # Adjust this as per number of teams to eliminate.
-            group_list.delete(group_list.get_tail().get_data()["name"]) # Delete by name from the tail end
+        # Remove the other teams, leaving the top two in order
+        group_list.replace(top_two)
 
         print(f"Qualified teams from Group {chr(65 + group_index)}:")
         for team in qualified_teams[-2:]:
@@ -254,42 +288,69 @@ def setup_knockout_round(groups):
     Returns:
         LinkedListt: A linked list of teams in the knockout stage.
     """
-    knockout_list = LinkedListt()
+    knockout_list = LinkedListt() # not indexed: teams from different groups may share a name
 
     for group in groups:
-        # Sort the group by points (descending)
-        group.sort(key=lambda team: team["points"], reverse=True)
-        current = group.head
-        count = 0
-
-        # Add top 2 teams to the knockout list
-        while current and count < 2:
-            knockout_list.append_team(current.get_data())
-            current = current.get_next()
-            count += 1
+        # Add the top 2 teams of the group's live standings to the knockout list
+        for team in group.get_standings().top(2):
+            knockout_list.append_team(team)
 
     return knockout_list
 
 
-def knockout_match_play(team1, team2):
+def knockout_win_counts(power1, power2):
+        """
+        Counts the scores of a knockout match in which each team wins, in O(1).
+
+        Team 1 scores uniformly in 0..power1 and team 2 in 0..power2. Team 1 wins with
+        sum(min(g, power2 + 1) for g in 0..power1) of the scores, and the match is decided
+        (not a tie) with all but min(power1, power2) + 1 of them. Both are closed forms,
+        so nothing is cached and any power works.
+
+        Parameters:
+        power1 (int): Power of the first team.
+        power2 (int): Power of the second team.
+
+        Returns:
+        tuple: Number of scores team 1 wins, and number of scores that are not a tie.
+
+        Raises:
+        ValueError: If a power is negative.
+        """
+        if power1 < 0 or power2 < 0:
+            raise ValueError("Team power cannot be negative.")
+
+        low = min(power1, power2 + 1)
+        wins = low * (low + 1) // 2 + (power1 - low) * (power2 + 1)
+        return wins, (power1 + 1) * (power2 + 1) - min(power1, power2) - 1
+
+
+def knockout_match_play(team1, team2, rng=random):
         """
         Simulates a knockout match between two teams. No ties are allowed.
 
+        The result has the same distribution as drawing randint(0, power) goals for both
+        teams until they differ, but the winner is drawn in one step from the exact
+        probability of team 1 winning given the match is not a tie.
+
         Parameters:
         team1 (dict): Data for the first team.
         team2 (dict): Data for the second team.
+        rng (random.Random, optional): Source of the result. Defaults to the random module.
 
         Returns:
         tuple: Winning and losing team data.
+
+        Raises:
+        ValueError: If both teams have power 0 (every match would be a 0-0 tie).
         """
-        while True:  # Ensure no ties
-            team1_goals = random.randint(0, team1["power"])
-            team2_goals = random.randint(0, team2["power"])
+        team1_wins, decided = knockout_win_counts(team1["power"], team2["power"])
+        if decided == 0:
+            raise ValueError(f"{team1['name']} and {team2['name']} both have power 0 and can only tie.")
 
-            if team1_goals > team2_goals:
-                return team1, team2
-            elif team2_goals > team1_goals:
-                return team2, team1
+        if rng.randrange(decided) < team1_wins:
+            return team1, team2
+        return team2, team1
 
 
 def knockout_update_after_match(knockout_list, losing_team_name):
@@ -303,25 +364,37 @@ def knockout_update_after_match(knockout_list, losing_team_name):
         knockout_list.delete(losing_team_name)
 
 
+def knockout_update_after_round(knockout_list, bracket):
+        """
+        Replaces the knockout linked list's teams with the teams left in the bracket, in O(n).
+
+        Parameters:
+        knockout_list (LinkedListt): The linked list of teams in the knockout round.
+        bracket (Bracket): The bracket the round was played on.
+        """
+        knockout_list.replace(bracket.remaining())
+
+
 def play_knockout_round(knockout_list, match_history):
     """
         Plays a single knockout round and updates the list.
 
+        The first team plays the second, the third plays the fourth, and so on, in one
+        pass over an array-backed Bracket (an odd team out gets a bye). The list is then
+        rebuilt from the winners instead of deleting each loser.
+
         Parameters:
         knockout_list (LinkedListt): The linked list of teams in the knockout round.
         match_history (MatchHistoryLinkedList): Linked list to store match history.
         
     
     """
-    current = knockout_list.head
+    bracket = Bracket.from_list(knockout_list)
+    if bracket.is_decided():
+        return
     game_number = match_history.size + 1
 
-    while current and current.get_next():
-        team1 = current.get_data()
-        team2 = current.get_next().get_data()
-
-        # Simulate the match
-        winner, loser = knockout_match_play(team1, team2)
+    for winner, loser in bracket.play_round(knockout_match_play):
         print(f"{winner['name']} defeated {loser['name']}")
 
         # Add the match result to history
@@ -329,11 +402,8 @@ def play_knockout_round(knockout_list, match_history):
                                 winner["power"], loser["power"])
         game_number += 1
 
-        # Remove the losing team from the list
-        knockout_update_after_match(knockout_list, loser["name"])
-
-        # Move to the next match pair
-        current = knockout_list.head  # Start from the head after modifying the lis
+    # Keep only the winners
+    knockout_update_after_round(knockout_list, bracket)
         
 
 def single_day_group_matches(groups, match_history):
@@ -350,6 +420,7 @@ def single_day_group_matches(groups, match_history):
     for group_index, group in enumerate(groups):
         print(f"\nSimulating matches for Group {chr(65 + group_index)}:")
 
+        standings = group.get_standings() # kept from earlier matchdays, not rebuilt
         games_played = 0
         current = group.head
         while current and games_played < 2:  # Limit to 2 matches per group
@@ -358,28 +429,28 @@ def single_day_group_matches(groups, match_history):
                 team1 = current.get_data()
                 team2 = opponent.get_data()
 
-                # Simulate match
-                updated_team1, updated_team2 = group_match_play(team1.copy(), team2.copy())
+                # Simulate match (as group_match_play does)
+                team1_goals, team2_goals = draw_power_goals(team1, team2)
                 
                 # Add match to history
                 match_history.add_match(match_history.size + 1, team1["name"], team2["name"], 
-                                        updated_team1["GD"], updated_team2["GD"])
+                                        team1_goals, team2_goals)
 
                 # Update standings
                 group_update_after_match(group, team1["name"], team2["name"], 
-                                         updated_team1["GD"], updated_team2["GD"])
+                                         team1_goals, team2_goals, standings)
 
                 games_played += 1
                 opponent = opponent.get_next()
             current = current.get_next()
 
-        # Sort group standings after matches
-        group.sort(key=lambda x: (x["points"], x["GD"], x["power"]), reverse=True)
+        # Put the group in standings order after matches
+        standings.relink()
 
 
 def single_day_knockout_matches(knockout_list, match_history):
     """
-    Simulates a single day of knockout stage matches.
+    Simulates a single day of knockout stage matches: one round of the bracket.
 
     Parameters:
         knockout_list (LinkedListt): The linked list of teams in the knockout round.
@@ -388,27 +459,21 @@ def single_day_knockout_matches(knockout_list, match_history):
     Returns:
         None
     """
-    current = knockout_list.head
+    bracket = Bracket.from_list(knockout_list)
     game_number = match_history.size + 1
 
     print("\nKnockout Matches:")
-    while current and current.get_next():
-        team1 = current.get_data()
-        team2 = current.get_next().get_data()
-
-        # Simulate the match
-        winner, loser = knockout_match_play(team1, team2)
+    if bracket.is_decided():
+        return
+    for winner, loser in bracket.play_round(knockout_match_play):
         print(f"{winner['name']} defeated {loser['name']}")
 
         # Add the match to history
         match_history.add_match(game_number, winner["name"], loser["name"], 0, 0)
         game_number += 1
 
-        # Remove losing team
-        knockout_update_after_match(knockout_list, loser["name"])
-
-        # Move to the next match pair
-        current = knockout_list.head
+    # Keep only the winners
+    knockout_update_after_round(knockout_list, bracket)
 
 
 def user_command(groups, knockout_list, phase):
@@ -429,11 +494,7 @@ def user_command(groups, knockout_list, phase):
             if phase == "group":
                 display_group_rankings(groups)
             elif phase == "knockout":
-                print("\nKnockout Stage Bracket:")
-                current = knockout_list.head
-                while current:
-                    print(f"{current.get_data()['name']}")
-                    current = current.get_next()
+                sys.stdout.write("\nKnockout Stage Bracket:\n" + format_bracket(knockout_list))
         elif user_input == "C":
             return True
         else:
@@ -503,8 +564,8 @@ def main():
         print("Error initializing teams. Exiting.")
         return
 
-    # Initialize the Match History Linked List
-    match_history = MatchHistoryLinkedList()
+    # Initialize the match history (columnar; MatchHistoryLinkedList works the same way)
+    match_history = MatchHistory()
 
     # Display initial group rankings
     print("\nInitial Group Rankings:")
@@ -541,8 +602,7 @@ def main():
         while user_command != "C":
             user_command = input("\nEnter 'S' to display knockout results and match history, or 'C' to continue: ").strip().upper()
             if user_command == "S":
-                print("\nKnockout Round Results:")
-                knockout_list.display()
+                sys.stdout.write("\nKnockout Round Results:\n" + format_bracket(knockout_list))
                 print("\nMatch History:")
                 match_history.display_history()
             elif user_command != "C":
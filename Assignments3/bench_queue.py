@@ -0,0 +1,79 @@
+"""
+Benchmark comparing the list-backed Queue with the ring-buffer CircularQueue.
+
+Two workloads are timed at 1e3, 1e5 and 1e7 operations:
+    steady - the queue holds a deck-sized window (52 items) and every
+             enqueue is paired with a dequeue, like cards cycling through
+             the deck during a game.
+    drain  - half of the operations fill the queue, the other half empty it.
+             This is where list.pop(0) turns quadratic, so the list-backed
+             queue is skipped above --list-limit operations.
+
+Usage:
+    python bench_queue.py [--sizes 1000 100000 10000000] [--list-limit 100000]
+"""
+import argparse
+import time
+
+from queuee import Queue, CircularQueue
+
+WINDOW = 52 # same size as the card deck
+
+
+def bench_steady(queue_class, operations):
+    """
+    Times `operations` enqueue/dequeue calls on a queue kept at WINDOW items.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    queue = queue_class(WINDOW)
+    for card in range(WINDOW - 1):
+        queue.enqueue(card)
+
+    start = time.perf_counter()
+    for card in range(operations // 2):
+        queue.enqueue(card)
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def bench_drain(queue_class, operations):
+    """
+    Times filling a queue with operations // 2 items and then emptying it.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    half = operations // 2
+    queue = queue_class(half)
+
+    start = time.perf_counter()
+    for card in range(half):
+        queue.enqueue(card)
+    while not queue.isEmpty():
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**5, 10**7])
+    parser.add_argument("--list-limit", type=int, default=10**5,
+                        help="largest drain run for the list-backed Queue")
+    args = parser.parse_args()
+
+    print(f"{'workload':<8} {'ops':>10} {'Queue (s)':>12} {'CircularQueue (s)':>18} {'speedup':>8}")
+    for workload, bench in (("steady", bench_steady), ("drain", bench_drain)):
+        for operations in args.sizes:
+            ring_time = bench(CircularQueue, operations)
+            if workload == "drain" and operations > args.list_limit:
+                print(f"{workload:<8} {operations:>10} {'skipped':>12} {ring_time:>18.4f} {'-':>8}")
+                continue
+            list_time = bench(Queue, operations)
+            print(f"{workload:<8} {operations:>10} {list_time:>12.4f} {ring_time:>18.4f} "
+                  f"{list_time / ring_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Headless engine for the Assignments3 card game.
+
+Plays the same rules as assignment3.py (deal, find_match, discard/swap,
+determine_winner) without printing or calling input(), so strategies can be
+compared over many seeded games. The discard/swap decision is made by a
+policy function instead of the keyboard:
+
+    policy(card, player_queue, table, rng) -> 'd' or 's'
+
+where card is the player's unmatched top card (a code from cards.py), player_queue is a deque of the
+player's queue (front first), table is a list of table cards (bottom first) and
+rng is the game's random.Random. Anything other than 's' is treated as a
+discard, just like an invalid choice in play_turn.
+
+Usage:
+    python cardgame.py [--games 100000] [--seed 0] [--policy discard swap random discard]
+"""
+import argparse
+import random
+import time
+from collections import deque
+
+from cards import load_deck, VALUES
+
+MATCH_TOTAL = 15 # a player card and a table card must add up to this
+NUM_PLAYERS = 4
+ROUNDS = 5
+QUEUE_CARDS = 5
+STACK_CARDS = 4
+TABLE_CARDS = 4
+MATCH_DEPTH = 4 # find_match only looks at the top 4 table cards
+MATCH_POINTS = 15
+GAME_STRIDE = 2 ** 32 # game seeds are master_seed * GAME_STRIDE + game_index
+
+
+def game_seed(master_seed, game_index):
+    """
+    Returns the seed of one game. Every game gets its own seed, so a game's result
+    does not depend on which games were played before it or on which process played it.
+    """
+    return master_seed * GAME_STRIDE + game_index
+
+
+def always_discard(card, player_queue, table, rng):
+    """Policy that always discards an unmatched card."""
+    return 'd'
+
+
+def always_swap(card, player_queue, table, rng):
+    """Policy that always swaps an unmatched card with the front of the player's queue."""
+    return 's'
+
+
+def random_choice(card, player_queue, table, rng):
+    """Policy that discards or swaps with equal probability."""
+    return 'd' if rng.random() < 0.5 else 's'
+
+
+POLICIES = {'discard': always_discard, 'swap': always_swap, 'random': random_choice}
+
+
+def find_winners(player_scores):
+    """
+    Returns the winning player numbers (1-based) the same way determine_winner picks them.
+    All players sharing the top score are winners; when every player does, nobody wins.
+    """
+    max_score = max(player_scores)
+    return [i + 1 for i, score in enumerate(player_scores) if score == max_score]
+
+
+class SimulationResult:
+    """
+    Aggregated outcome of many games.
+
+    Attributes:
+        games (int): Number of games played.
+        score_counts (list): One dict per player mapping final score -> number of games.
+        wins (list): Games each player won outright.
+        shared_wins (list): Games each player tied for first with some (not all) players.
+        no_winner (int): Games where every player tied ("No one Wins!").
+    """
+
+    def __init__(self, num_players=NUM_PLAYERS):
+        self.games = 0
+        self.score_counts = [{} for _ in range(num_players)]
+        self.wins = [0] * num_players
+        self.shared_wins = [0] * num_players
+        self.no_winner = 0
+
+    def add_game(self, player_scores):
+        """Counts the final scores of one game."""
+        self.games += 1
+        for counts, score in zip(self.score_counts, player_scores):
+            counts[score] = counts.get(score, 0) + 1
+
+        winners = find_winners(player_scores)
+        if len(winners) == len(player_scores):
+            self.no_winner += 1
+        elif len(winners) == 1:
+            self.wins[winners[0] - 1] += 1
+        else:
+            for w in winners:
+                self.shared_wins[w - 1] += 1
+
+    def merge(self, other):
+        """Adds the counts of another result into this one and returns self."""
+        self.games += other.games
+        for counts, other_counts in zip(self.score_counts, other.score_counts):
+            for score, n in other_counts.items():
+                counts[score] = counts.get(score, 0) + n
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.shared_wins = [a + b for a, b in zip(self.shared_wins, other.shared_wins)]
+        self.no_winner += other.no_winner
+        return self
+
+    def mean_scores(self):
+        """Returns the average final score of each player."""
+        if not self.games:
+            return [0.0] * len(self.score_counts)
+        return [sum(score * n for score, n in counts.items()) / self.games
+                for counts in self.score_counts]
+
+    def __eq__(self, other):
+        return (isinstance(other, SimulationResult) and self.games == other.games
+                and self.score_counts == other.score_counts and self.wins == other.wins
+                and self.shared_wins == other.shared_wins and self.no_winner == other.no_winner)
+
+    def __str__(self):
+        lines = [f"Games: {self.games}"]
+        for i, counts in enumerate(self.score_counts):
+            histogram = ", ".join(f"{score}: {counts[score]}" for score in sorted(counts))
+            lines.append(f"Player_{i + 1}: wins={self.wins[i]} shared={self.shared_wins[i]} "
+                         f"mean={self.mean_scores()[i]:.2f} scores={{{histogram}}}")
+        lines.append(f"No winner: {self.no_winner}")
+        return "\n".join(lines)
+
+
+def play_game(cards, policies, rng, values=VALUES):
+    """
+    Plays one game without any I/O.
+
+    Parameters:
+        cards (array): The unshuffled deck as card codes.
+        policies (list): One discard/swap policy per player.
+        rng (random.Random): Source of randomness for the shuffle and the policies.
+        values (sequence, optional): Card value by card code. Defaults to cards.VALUES.
+
+    Returns:
+        list: The final score of each player.
+    """
+    items = list(cards)
+    rng.shuffle(items)
+    return play_dealt(items, policies, rng, values)
+
+
+def play_dealt(items, policies, rng, values=VALUES):
+    """
+    Plays one game from an already shuffled deck, without any I/O.
+
+    Parameters:
+        items (list): The shuffled deck as card codes, in the order it is dealt.
+        policies (list): One discard/swap policy per player.
+        rng (random.Random): Passed on to the policies.
+        values (sequence, optional): Card value by card code. Defaults to cards.VALUES.
+
+    Returns:
+        list: The final score of each player.
+    """
+    # Deal exactly like assignment3.main: queues, then stacks, then the table
+    num_players = len(policies)
+    deal = num_players * QUEUE_CARDS
+    queues = [deque(items[i:i + QUEUE_CARDS]) for i in range(0, deal, QUEUE_CARDS)]
+    stacks = [items[i:i + STACK_CARDS] for i in range(deal, deal + num_players * STACK_CARDS, STACK_CARDS)]
+    deal += num_players * STACK_CARDS
+    table = items[deal:deal + TABLE_CARDS]
+    deck = deque(items[deal + TABLE_CARDS:])
+
+    # A match takes one table card and puts one back, so the table never changes size
+    # and the cards find_match looks at can be worked out once per game.
+    scan = range(len(table) - 1, max(-1, len(table) - 1 - MATCH_DEPTH), -1)
+
+    scores = [0] * num_players
+    for player_num in range(num_players):
+        stack = stacks[player_num]
+        queue = queues[player_num]
+        policy = policies[player_num]
+        for _ in range(ROUNDS):
+            if not stack:
+                break # an empty stack stays empty for the rest of this player's rounds
+
+            card = stack[-1]
+            wanted = MATCH_TOTAL - values[card]
+            # find_match: scan down from the top of the table
+            match_index = -1
+            for i in scan:
+                if values[table[i]] == wanted:
+                    match_index = i
+                    break
+
+            if match_index >= 0:
+                scores[player_num] += MATCH_POINTS
+                deck.append(stack.pop())
+                deck.append(table.pop(match_index))
+                table.append(deck.popleft())
+            elif policy(card, queue, table, rng) == 's':
+                if queue:
+                    queue.popleft()
+                    queue.append(stack.pop())
+            else:
+                deck.append(stack.pop())
+    return scores
+
+
+def simulate(num_games, policies=None, master_seed=0, start=0, cards=None):
+    """
+    Plays num_games seeded games and aggregates their scores.
+
+    Parameters:
+        num_games (int): Number of games to play.
+        policies (list or callable, optional): One policy per player, or one policy for
+                                               everybody. Defaults to always_discard.
+        master_seed (int): Seed the per-game seeds are derived from.
+        start (int): Index of the first game, so ranges of games can be played separately.
+        cards (array, optional): The deck as card codes. Defaults to the cards in cards.txt.
+
+    Returns:
+        SimulationResult: Score distributions and win counts.
+    """
+    if policies is None:
+        policies = always_discard
+    if callable(policies):
+        policies = [policies] * NUM_PLAYERS
+    if cards is None:
+        cards = load_deck()
+
+    result = SimulationResult(len(policies))
+    rng = random.Random()
+    for game_index in range(start, start + num_games):
+        rng.seed(game_seed(master_seed, game_index))
+        result.add_game(play_game(cards, policies, rng))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many card games without any I/O.")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", nargs="+", choices=sorted(POLICIES), default=["discard"],
+                        help="one policy for everybody, or one per player")
+    args = parser.parse_args()
+
+    policies = [POLICIES[name] for name in args.policy]
+    if len(policies) == 1:
+        policies = policies * NUM_PLAYERS
+
+    start = time.perf_counter()
+    result = simulate(args.games, policies, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(result)
+    print(f"{args.games / elapsed:,.0f} games/second ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
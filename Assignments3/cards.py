@@ -0,0 +1,79 @@
+"""
+Compact card encoding for the Assignments3 card game.
+
+A card such as "9O" is parsed once into a small int:
+
+    code = rank << 2 | colour
+
+with rank 1-13 and colour the index of its letter in COLOURS, so every card fits in
+one byte and a whole deck fits in an array('B'). Small ints are shared objects in
+Python, so queues and stacks holding codes do not allocate anything per card.
+Everything the game needs from a card is looked up by code in tables built once at
+import time: VALUES for find_match, NAMES for text and RENDERED for coloured output.
+"""
+from array import array
+
+COLOURS = 'RGOP'
+COLOR_CODES = {'R': '\033[41m', 'G': '\033[42m', 'O': '\033[43m', 'P': '\033[105m'}
+RESET_CODE = '\033[0m'
+MAX_RANK = 13
+NUM_CODES = (MAX_RANK + 1) << 2
+
+
+def encode(card):
+    """
+    Packs a card string such as "11P" into its code.
+
+    Raises:
+        ValueError: If the rank or colour is not valid.
+    """
+    card = card.strip()
+    if len(card) < 2 or card[-1] not in COLOURS or not card[:-1].isdigit():
+        raise ValueError(f"Invalid card: {card!r}")
+    rank = int(card[:-1])
+    if not 1 <= rank <= MAX_RANK:
+        raise ValueError(f"Invalid card rank: {card!r}")
+    return rank << 2 | COLOURS.index(card[-1])
+
+
+def rank(code):
+    """Returns the rank (1-13) of a card code."""
+    return code >> 2
+
+
+def colour(code):
+    """Returns the colour letter of a card code."""
+    return COLOURS[code & 3]
+
+
+def decode(code):
+    """Returns the card string of a code, e.g. "11P"."""
+    return f"{code >> 2}{COLOURS[code & 3]}"
+
+
+# Lookup tables indexed by code. Unused codes (rank 0) decode to "0R" and never appear in a deck.
+NAMES = [decode(code) for code in range(NUM_CODES)]
+# find_match has always read a card's value from its first character, so "11O" counts as 1.
+VALUES = array('B', (int(name[0]) for name in NAMES))
+RENDERED = [f"{COLOR_CODES[name[-1]]}{name}{RESET_CODE}" for name in NAMES]
+
+
+def card_value(code):
+    """Returns the value find_match uses for a card code."""
+    return VALUES[code]
+
+
+def render(code):
+    """Returns the card as a coloured string for the terminal."""
+    return RENDERED[code]
+
+
+def load_deck(file_name='cards.txt'):
+    """
+    Reads the cards from a text file, one card per line, and packs them.
+
+    Returns:
+        array: The card codes in file order, one byte per card.
+    """
+    with open(file_name, 'r') as cd:
+        return array('B', (encode(card) for card in cd if card.strip()))
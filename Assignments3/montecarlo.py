@@ -0,0 +1,124 @@
+"""
+Multiprocess Monte Carlo runner for comparing card game strategies.
+
+Games are split into fixed-size shards of consecutive game indexes. Every game
+is seeded from (master_seed, game index) by cardgame.game_seed, and shard
+results are merged by adding counts, so the totals for a master seed are the
+same whether 1 or N worker processes play them.
+
+Usage:
+    python montecarlo.py [--games 1000000] [--seed 0] [--workers N] [--scaling]
+                         [--policy discard swap]
+"""
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+import cardgame
+from cards import load_deck
+
+SHARD_SIZE = 20000 # games per task; part of the seeding scheme only through the game index
+
+
+def _play_shard(args):
+    """Worker entry point: plays one shard of games and returns its SimulationResult."""
+    start, num_games, policies, master_seed, cards = args
+    return cardgame.simulate(num_games, policies, master_seed, start, cards)
+
+
+def run_parallel(num_games, policies=None, master_seed=0, workers=None, shard_size=SHARD_SIZE):
+    """
+    Plays num_games seeded games across a pool of worker processes.
+
+    Parameters:
+        num_games (int): Number of games to play.
+        policies (list or callable, optional): Policies as accepted by cardgame.simulate.
+                                               They must be module-level functions so they can be pickled.
+        master_seed (int): Seed the per-game seeds are derived from.
+        workers (int, optional): Number of processes. Defaults to os.cpu_count().
+        shard_size (int): Number of games handed to a worker at a time.
+
+    Returns:
+        cardgame.SimulationResult: Merged score histograms and win counts.
+    """
+    if policies is None:
+        policies = cardgame.always_discard
+    if callable(policies):
+        policies = [policies] * cardgame.NUM_PLAYERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    cards = load_deck() # a 52-byte array, cheap to send to every worker
+    shards = [(start, min(shard_size, num_games - start), policies, master_seed, cards)
+              for start in range(0, num_games, shard_size)]
+
+    result = cardgame.SimulationResult(len(policies))
+    if workers == 1:
+        for shard in shards: # no pool needed, and no pickling overhead
+            result.merge(_play_shard(shard))
+        return result
+
+    with Pool(workers) as pool:
+        for shard_result in pool.imap(_play_shard, shards):
+            result.merge(shard_result)
+    return result
+
+
+def scaling_report(num_games, policies=None, master_seed=0, max_workers=None):
+    """
+    Runs the same games with 1..max_workers processes and prints games/second and
+    scaling efficiency (speedup over one process divided by the number of processes).
+
+    Returns:
+        cardgame.SimulationResult: The result of the runs, which must all be identical.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    print(f"{'workers':>7} {'seconds':>9} {'games/s':>12} {'efficiency':>10}")
+    baseline_rate = None
+    reference = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = run_parallel(num_games, policies, master_seed, workers)
+        elapsed = time.perf_counter() - start
+
+        rate = num_games / elapsed
+        if baseline_rate is None:
+            baseline_rate = rate
+            reference = result
+        elif result != reference:
+            raise RuntimeError(f"Results with {workers} workers differ from the 1 worker run")
+        efficiency = rate / (baseline_rate * workers)
+        print(f"{workers:>7} {elapsed:>9.2f} {rate:>12,.0f} {efficiency:>9.0%}")
+    return reference
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare card game policies over many games.")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--policy", nargs="+", choices=sorted(cardgame.POLICIES),
+                        default=["discard", "swap"],
+                        help="policies to compare; each one is played by all four players")
+    parser.add_argument("--scaling", action="store_true",
+                        help="time the first policy with 1..workers processes instead")
+    args = parser.parse_args()
+
+    if args.scaling:
+        scaling_report(args.games, cardgame.POLICIES[args.policy[0]], args.seed, args.workers)
+        return
+
+    for name in args.policy:
+        start = time.perf_counter()
+        result = run_parallel(args.games, cardgame.POLICIES[name], args.seed, args.workers)
+        elapsed = time.perf_counter() - start
+        print(f"\nPolicy: {name}")
+        print(result)
+        print(f"{args.games / elapsed:,.0f} games/second ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -69,4 +69,156 @@ class Queue:
     # Removes all items from the queue, and sets the size to 0    
     # clear() should not change the capacity    
     def clear(self):        
-        self.__items = []
\ No newline at end of file
+        self.__items = []
+
+    # Adds every item to the back of the queue in order, and returns nothing.
+    # Capacity is checked once for the whole batch, so either all items go in or none do.
+    def enqueue_many(self, items):
+        items = list(items)
+        if len(self.__items) + len(items) > self.__capacity:
+            raise Exception('the queue is currently full')
+        self.__items.extend(items)
+
+    # Removes and returns the n front-most items as a list, front first.
+    def dequeue_many(self, n):
+        if n < 0:
+            raise Exception('Cannot dequeue a negative number of items!')
+        if n > len(self.__items):
+            raise Exception("Cannot dequeue from an empty queue!")
+        front = self.__items[:n]
+        del self.__items[:n] # one shift for the whole batch instead of one per item
+        return front
+
+    # Iterates over the items from front to back WITHOUT removing them.
+    def __iter__(self):
+        return iter(self.__items)
+
+    # Returns the items from front to back as a tuple, and DOES NOT change the queue.
+    def snapshot(self):
+        return tuple(self.__items)
+
+
+class CircularQueue:
+    # Creates a new empty queue backed by a fixed block of preallocated slots.
+    # Same interface as Queue, but enqueue and dequeue are both O(1):
+    # the front and back move around the slots instead of shifting the items.
+    def __init__(self, capacity):
+        assert isinstance(capacity, int), ('Error: Type error: %s' % (type(capacity))) # throws an assertion error on not true
+        assert capacity >= 0, ('Error: Illegal capacity: %d' % (capacity))
+        self.__items = [None] * capacity # preallocate every slot up front
+        self.__capacity = capacity
+        self.__head = 0 # index of the front-most item
+        self.__tail = 0 # index of the next free slot at the back
+        self.__count = 0
+
+    # Adds a new item to the back of the queue, and returns nothing:
+    def enqueue(self, item):
+        '''
+        Enqueue the element to the back of the queue
+        :param item: the element to be enqueued
+        :return: No returns
+        '''
+        if self.__count >= self.__capacity:
+            raise Exception('the queue is currently full')
+
+        self.__items[self.__tail] = item
+        self.__tail += 1
+        if self.__tail == self.__capacity: # wrap around to the first slot
+            self.__tail = 0
+        self.__count += 1
+
+    # Removes and returns the front-most item in the queue.
+    def dequeue(self):
+        '''
+        Dequeue the element from the front of the queue and return it
+        :return: The object that was dequeued
+        '''
+        if self.__count == 0:
+            raise Exception("Cannot dequeue from an empty queue!")
+
+        item = self.__items[self.__head]
+        self.__items[self.__head] = None # drop the reference so the slot does not keep it alive
+        self.__head += 1
+        if self.__head == self.__capacity:
+            self.__head = 0
+        self.__count -= 1
+        return item
+
+    # Returns the front-most item in the queue, and DOES NOT change the queue.
+    def peek(self):
+        if self.__count <= 0:
+            raise Exception('Error: Queue is empty')
+        return self.__items[self.__head]
+
+    # Returns True if the queue is empty, and False otherwise:
+    def isEmpty(self):
+        return self.__count == 0
+
+    # Returns True if the queue is full, and False otherwise:
+    def isFull(self):
+        return self.__count == self.__capacity
+
+    # Returns the number of items in the queue:
+    def size(self):
+        return self.__count
+
+    # Returns the capacity of the queue:
+    def capacity(self):
+        return self.__capacity
+
+    # Removes all items from the queue, and sets the size to 0
+    # clear() should not change the capacity
+    def clear(self):
+        self.__items = [None] * self.__capacity
+        self.__head = 0
+        self.__tail = 0
+        self.__count = 0
+
+    # Adds every item to the back of the queue in order, and returns nothing.
+    # Capacity is checked once for the whole batch, so either all items go in or none do.
+    def enqueue_many(self, items):
+        items = list(items)
+        n = len(items)
+        if self.__count + n > self.__capacity:
+            raise Exception('the queue is currently full')
+        if n == 0:
+            return
+
+        # copy in at most two slices: up to the end of the slots, then the wrapped part
+        first = min(n, self.__capacity - self.__tail)
+        self.__items[self.__tail:self.__tail + first] = items[:first]
+        self.__items[:n - first] = items[first:]
+        self.__tail = (self.__tail + n) % self.__capacity
+        self.__count += n
+
+    # Removes and returns the n front-most items as a list, front first.
+    def dequeue_many(self, n):
+        if n < 0:
+            raise Exception('Cannot dequeue a negative number of items!')
+        if n > self.__count:
+            raise Exception("Cannot dequeue from an empty queue!")
+        front = self.__window(n)
+        first = min(n, self.__capacity - self.__head)
+        self.__items[self.__head:self.__head + first] = [None] * first
+        self.__items[:n - first] = [None] * (n - first)
+        if self.__capacity:
+            self.__head = (self.__head + n) % self.__capacity
+        self.__count -= n
+        return front
+
+    # Iterates over the items from front to back WITHOUT removing them.
+    def __iter__(self):
+        head, capacity, items = self.__head, self.__capacity, self.__items
+        for i in range(self.__count):
+            yield items[(head + i) % capacity]
+
+    # Returns the items from front to back as a tuple, and DOES NOT change the queue.
+    def snapshot(self):
+        return tuple(self.__window(self.__count))
+
+    # Returns the n front-most items as a list, reading across the wrap point.
+    def __window(self, n):
+        end = self.__head + n
+        if end <= self.__capacity:
+            return self.__items[self.__head:end]
+        return self.__items[self.__head:] + self.__items[:end - self.__capacity]
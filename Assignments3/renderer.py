@@ -0,0 +1,118 @@
+"""
+Buffered terminal rendering for the Assignments3 card game.
+
+Frames are built as one string and written with a single call instead of one
+print per card. The Renderer has three modes:
+    full  - redraw every player and the table after each turn (the original output)
+    diff  - after the first frame, redraw only the players and table that changed
+    quiet - render nothing, for timing runs
+"""
+import sys
+
+from cards import render
+
+PLAYER_RULE = "\n" + "-" * 30 + "\n"
+FRAME_RULE = "\n" + "=" * 50 + "\n"
+
+
+def format_table(table_stack):
+    """Returns the table line, top card first, e.g. "Table: 9O 3R \\n"."""
+    return "Table: " + "".join(f"{render(card)} " for card in table_stack) + "\n"
+
+
+def format_player(player_num, player_queue, player_stack):
+    """Returns one player's queue (front to back) and stack (top to bottom) as text."""
+    queue_cards = "".join(f"| {render(card)} " for card in player_queue)
+    stack_cards = "".join(f"[ {render(card)} ] " for card in player_stack)
+    return (f"Player {player_num + 1}:\n"
+            f"Queue -> {queue_cards}|\n"
+            f"         Stack -> {stack_cards}\n"
+            f"{PLAYER_RULE}")
+
+
+def format_game_state(players_Queue, players_Stack, table_stack):
+    """
+    Returns a whole game state frame as one string.
+
+    Parameters:
+        players_Queue (list): Every player's queue.
+        players_Stack (list): Every player's stack.
+        table_stack (Table): The table.
+    """
+    parts = ["Current Game State:\n\n"]
+    for player_num in range(len(players_Queue)):
+        parts.append(format_player(player_num, players_Queue[player_num], players_Stack[player_num]))
+    parts.append("The Table:\n")
+    parts.append(format_table(table_stack))
+    parts.append(FRAME_RULE)
+    return "".join(parts)
+
+
+class Renderer:
+    """
+    Collects a turn's messages and game state into one buffer and writes it in one call.
+
+    Attributes:
+        mode (str): "full", "diff" or "quiet".
+    """
+
+    MODES = ("full", "diff", "quiet")
+
+    def __init__(self, mode="full", out=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown render mode: {mode}")
+        self.mode = mode
+        self.__out = out if out is not None else sys.stdout
+        self.__buffer = []
+        self.__last_players = None # per player (queue, stack) snapshots of the last drawn frame
+        self.__last_table = None
+
+    def message(self, text):
+        """Adds a line of text to the current frame."""
+        if self.mode != "quiet":
+            self.__buffer.append(text + "\n")
+
+    def table(self, table_stack):
+        """Adds the table line to the current frame."""
+        if self.mode != "quiet":
+            self.__buffer.append(format_table(table_stack))
+
+    def game_state(self, players_Queue, players_Stack, table_stack):
+        """
+        Adds the game state to the current frame. In diff mode only the players whose queue
+        or stack changed since the last frame are drawn, and the table only if it changed.
+        """
+        if self.mode == "quiet":
+            return
+        if self.mode == "full":
+            self.__buffer.append(format_game_state(players_Queue, players_Stack, table_stack))
+            return
+
+        players = [(q.snapshot(), s.snapshot()) for q, s in zip(players_Queue, players_Stack)]
+        table = table_stack.snapshot()
+        if self.__last_players is None: # first frame: draw everything
+            changed = range(len(players))
+            table_changed = True
+        else:
+            changed = [i for i, p in enumerate(players) if p != self.__last_players[i]]
+            table_changed = table != self.__last_table
+        self.__last_players = players
+        self.__last_table = table
+
+        if not changed and not table_changed:
+            return
+        parts = ["Current Game State:\n\n"]
+        for player_num in changed:
+            parts.append(format_player(player_num, players_Queue[player_num], players_Stack[player_num]))
+        if table_changed:
+            parts.append("The Table:\n")
+            parts.append(format_table(table_stack))
+        parts.append(FRAME_RULE)
+        self.__buffer.append("".join(parts))
+
+    def flush(self):
+        """Writes everything collected so far in a single call."""
+        if self.__buffer:
+            self.__out.write("".join(self.__buffer))
+            self.__out.flush()
+            self.__buffer = []
@@ -0,0 +1,201 @@
+"""
+Compact binary game logs and deterministic replay for the Assignments3 card game.
+
+A log holds everything needed to play a game again: the seed, the shuffled deck
+order, the answer to every discard/swap question play_turn asked, and the final
+scores. Layout (little-endian):
+
+    magic "CG15" | version B | seed Q | players B | deck length B | deck codes
+    | decisions H | one byte per decision | one score H per player
+
+Decision bytes are b'd' (discard), b's' (swap) and b'x' (any other answer, which
+play_turn treats as a discard). Turns that end in a match, or find an empty stack,
+ask nothing and so record nothing. A 4 player game is under 100 bytes.
+
+Usage:
+    python replay.py GAME_LOG [--policy discard] [--repeat 10000]
+"""
+import argparse
+import random
+import struct
+import time
+from array import array
+
+import cardgame
+from cards import load_deck
+
+MAGIC = b'CG15'
+VERSION = 1
+HEADER = struct.Struct('<4sBQBB')
+OTHER_DECISION = 'x'
+
+
+class GameLog:
+    """
+    The record of one game.
+
+    Attributes:
+        seed (int): Seed the deck was shuffled with (0 to 2**64 - 1).
+        deck (array): The shuffled deck as card codes, in dealing order.
+        decisions (bytearray): The answer to each discard/swap question, in play order.
+        scores (list): The final score of each player.
+    """
+
+    def __init__(self, seed, deck, num_players=cardgame.NUM_PLAYERS):
+        self.seed = seed
+        self.deck = array('B', deck)
+        self.decisions = bytearray()
+        self.scores = [0] * num_players
+
+    def record(self, choice):
+        """Adds the (lower-cased) answer to one discard/swap question."""
+        self.decisions.append(ord(choice if choice in ('d', 's') else OTHER_DECISION))
+
+    def answers(self):
+        """Returns the recorded answers in play order, as 'd', 's' or 'x'."""
+        return [chr(b) for b in self.decisions]
+
+    def to_bytes(self):
+        """Returns the log in its binary form."""
+        return b''.join((
+            HEADER.pack(MAGIC, VERSION, self.seed, len(self.scores), len(self.deck)),
+            self.deck.tobytes(),
+            struct.pack('<H', len(self.decisions)),
+            bytes(self.decisions),
+            struct.pack(f'<{len(self.scores)}H', *self.scores),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Reads a log from its binary form.
+
+        Raises:
+            ValueError: If the data is not a game log of a supported version.
+        """
+        try:
+            magic, version, seed, num_players, deck_length = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not a card game log, or a log from an unsupported version.")
+            offset = HEADER.size
+            log = cls(seed, data[offset:offset + deck_length], num_players)
+            offset += deck_length
+            (count,) = struct.unpack_from('<H', data, offset)
+            offset += 2
+            log.decisions = bytearray(data[offset:offset + count])
+            offset += count
+            log.scores = list(struct.unpack_from(f'<{num_players}H', data, offset))
+        except struct.error as e:
+            raise ValueError(f"Truncated game log: {e}")
+        return log
+
+    def save(self, file_name):
+        """Writes the log to a file in one write."""
+        with open(file_name, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, file_name):
+        """Reads a log from a file."""
+        with open(file_name, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def shuffled_deck(seed, cards=None):
+    """Returns the deck (cards.txt by default) shuffled the way a game with this seed shuffles it."""
+    items = list(cards if cards is not None else load_deck())
+    random.Random(seed).shuffle(items)
+    return items
+
+
+def game_rng(seed, deck_length):
+    """
+    Returns the random generator a policy sees in a game with this seed: seeded, then
+    advanced past the shuffle, exactly as in cardgame.play_game.
+    """
+    rng = random.Random(seed)
+    rng.shuffle([None] * deck_length) # a shuffle uses the same random numbers whatever the cards are
+    return rng
+
+
+def logged_policies(log):
+    """
+    Returns one policy per player that gives the logged answers in order,
+    so the engine makes exactly the choices that were made when the game was recorded.
+    """
+    answers = iter(log.answers())
+
+    def from_log(card, player_queue, table, rng):
+        return next(answers)
+
+    return [from_log] * len(log.scores)
+
+
+def record_game(seed, policies, cards=None):
+    """
+    Plays one game with the headless engine and returns its log.
+    With seed = cardgame.game_seed(master_seed, i) this is game i of cardgame.simulate, so
+    a simulated game that looked odd or slow can be kept and replayed exactly.
+    """
+    items = shuffled_deck(seed, cards)
+    log = GameLog(seed, items, len(policies))
+
+    def recording(policy):
+        def record_choice(card, player_queue, table, rng):
+            choice = policy(card, player_queue, table, rng)
+            log.record(choice)
+            return choice
+        return record_choice
+
+    log.scores = cardgame.play_dealt(list(items), [recording(p) for p in policies],
+                                     game_rng(seed, len(items)))
+    return log
+
+
+def replay(log, policies=None):
+    """
+    Plays a logged game again at full speed, without input() or output.
+
+    Parameters:
+        log (GameLog): The game to replay.
+        policies (list, optional): Play the logged deal with these policies instead of the
+                                   logged decisions, to compare a strategy on the same cards.
+
+    Returns:
+        list: The final score of each player.
+    """
+    if policies is None:
+        policies = logged_policies(log)
+    return cardgame.play_dealt(list(log.deck), policies, game_rng(log.seed, len(log.deck)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a logged card game without any input.")
+    parser.add_argument("log", help="game log written by assignment3.py --log")
+    parser.add_argument("--policy", choices=sorted(cardgame.POLICIES),
+                        help="replay the same deal with this policy instead of the logged decisions")
+    parser.add_argument("--repeat", type=int, default=1, help="replay this many times, for timing")
+    args = parser.parse_args()
+
+    log = GameLog.load(args.log)
+    policies = None
+    if args.policy:
+        policies = [cardgame.POLICIES[args.policy]] * len(log.scores)
+    if shuffled_deck(log.seed) != list(log.deck):
+        print("Warning: the logged deck is not the seed's shuffle of cards.txt (was cards.txt changed?).")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        scores = replay(log, policies)
+    elapsed = time.perf_counter() - start
+
+    print(f"Seed: {log.seed}")
+    print(f"Logged scores:   {log.scores}")
+    print(f"Replayed scores: {scores}")
+    if policies is None:
+        print("Replay matches the log." if scores == log.scores else "Replay DIFFERS from the log!")
+    print(f"{args.repeat / elapsed:,.0f} replays/second")
+
+
+if __name__ == "__main__":
+    main()
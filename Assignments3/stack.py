@@ -41,7 +41,7 @@ class Stack:
     def __str__(self):
         stackAsString = ''
         for item in self.items:
-            stackAsString += item + ' '
+            stackAsString += str(item) + ' '
         return stackAsString
     
     def clear(self):
@@ -51,4 +51,38 @@ class Stack:
         """
         self.items = [] # Replaces/Overwrites the current stack with a new empty stack clearing the former stack be it empty or contained.
 
+    def push_many(self, items):
+        """
+        Function to push several items onto the stack in order, so the last item ends up on top.
+        Parameters: items - any iterable of items
+        """
+        self.items.extend(items)
+
+    def pop_many(self, n):
+        """
+        Function to pop the n top-most items, returned top first (the order repeated pop() calls would give),
+        and raises an IndexError if n is negative or the stack holds fewer than n items.
+        Parameters: n - the number of items to pop
+        """
+        if n < 0:
+            raise IndexError("You cannot pop a negative number of items ")
+        if n > len(self.items):
+            raise IndexError("You are trying to pop more items than the stack holds ")
+        top = self.items[len(self.items) - n:]
+        del self.items[len(self.items) - n:]
+        top.reverse()
+        return top
+
+    def __iter__(self):
+        """
+        Iterates over the items from the top of the stack to the bottom WITHOUT popping them.
+        Parameters: None
+        """
+        return reversed(self.items)
 
+    def snapshot(self):
+        """
+        Function to return the items from top to bottom as a tuple, and does not change the stack.
+        Parameters: None
+        """
+        return tuple(reversed(self.items))
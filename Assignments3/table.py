@@ -0,0 +1,165 @@
+from cardgame import MATCH_TOTAL
+from cards import card_value
+
+NUM_VALUES = 10 # card values are single digits, 0-9
+
+
+class Table:
+    """
+    The cards on the table: a stack (same interface as Stack) that also keeps an
+    index from card value to the cards holding it, so "is there a card that makes 15
+    with this one?" is answered without popping and re-pushing the table.
+
+    Every pushed card gets an increasing sequence number. The cards are kept in a dict
+    keyed by that number, which keeps stack order and allows O(1) removal from the middle,
+    and each value has a list of the sequence numbers holding it, in push order.
+    The top-most card of a value is therefore always the last number in its list.
+    """
+
+    def __init__(self, capacity, value=card_value):
+        self.__capacity = capacity
+        self.__value = value
+        self.__cards = {} # sequence number -> card, bottom to top
+        self.__by_value = [[] for _ in range(NUM_VALUES)]
+        self.__next_seq = 0
+
+    def push(self, item):
+        """
+        Function to push a card on top of the table.
+        Parameters: item - the card
+        """
+        seq = self.__next_seq
+        self.__next_seq += 1
+        self.__cards[seq] = item
+        self.__by_value[self.__value(item)].append(seq)
+
+    def pop(self):
+        """
+        Function to pop the top card of the table and raises an IndexError if the table is empty
+        Parameters: None
+        """
+        if not self.__cards:
+            raise IndexError("You are trying to pop an item from an empty stack ")
+        item = self.__cards.pop(next(reversed(self.__cards)))
+        self.__by_value[self.__value(item)].pop() # the top card is the newest of its value
+        return item
+
+    def peek(self):
+        """
+        Function to peep the top card of the table and raises an IndexError if the table is empty
+        Parameters: None
+        """
+        if not self.__cards:
+            raise IndexError("You are trying to peep an item in an empty stack ")
+        return self.__cards[next(reversed(self.__cards))]
+
+    def isEmpty(self):
+        return not self.__cards
+
+    def size(self):
+        return len(self.__cards)
+
+    def clear(self):
+        """
+        The Function Removes all cards from the table and does nothing if the table is currently empty.
+        Parameters: None
+        """
+        self.__cards = {}
+        self.__by_value = [[] for _ in range(NUM_VALUES)]
+
+    def push_many(self, items):
+        """
+        Function to push several cards in order, so the last card ends up on top.
+        Parameters: items - any iterable of cards
+        """
+        for item in items:
+            self.push(item)
+
+    def pop_many(self, n):
+        """
+        Function to pop the n top-most cards, returned top first,
+        and raises an IndexError if n is negative or the table holds fewer than n cards.
+        Parameters: n - the number of cards to pop
+        """
+        if n < 0:
+            raise IndexError("You cannot pop a negative number of items ")
+        if n > len(self.__cards):
+            raise IndexError("You are trying to pop more items than the stack holds ")
+        return [self.pop() for _ in range(n)]
+
+    def __iter__(self):
+        """
+        Iterates over the cards from the top of the table to the bottom WITHOUT popping them.
+        Parameters: None
+        """
+        return reversed(self.__cards.values())
+
+    def snapshot(self):
+        """
+        Function to return the cards from top to bottom as a tuple, and does not change the table.
+        Parameters: None
+        """
+        return tuple(reversed(self.__cards.values()))
+
+    def counts(self):
+        """
+        Function to return how many cards of each value (0-9) are on the table.
+        Parameters: None
+        """
+        return [len(seqs) for seqs in self.__by_value]
+
+    def has_complement(self, value, total=MATCH_TOTAL):
+        """
+        Function to check in O(1) whether some table card's value plus value equals total.
+        Parameters: value - the player's card value, total - the sum to reach
+        """
+        wanted = total - value
+        return 0 <= wanted < NUM_VALUES and bool(self.__by_value[wanted])
+
+    def take_complement(self, value, total=MATCH_TOTAL):
+        """
+        Function to remove and return the top-most table card whose value plus value equals total,
+        or None if there is no such card. Every other card keeps its place in the stack.
+        Parameters: value - the player's card value, total - the sum to reach
+        """
+        if not self.has_complement(value, total):
+            return None
+        return self.__cards.pop(self.__by_value[total - value].pop())
+
+    def find_combination(self, total, k):
+        """
+        Function to find k table cards whose values add up to total, looking only at the value counts,
+        so the cost depends on k and not on how many cards are on the table.
+        Returns the values as a list (smallest first), or None if no combination exists.
+        Parameters: total - the sum to reach, k - how many table cards to use
+        """
+        counts = self.counts()
+
+        def search(remaining, k, smallest):
+            if k == 0:
+                return [] if remaining == 0 else None
+            for value in range(smallest, NUM_VALUES):
+                if value * k > remaining: # values only grow from here, so nothing further can fit
+                    break
+                if counts[value]:
+                    counts[value] -= 1
+                    rest = search(remaining - value, k - 1, value)
+                    counts[value] += 1
+                    if rest is not None:
+                        return [value] + rest
+            return None
+
+        return search(total, k, 0)
+
+    def take_values(self, values):
+        """
+        Function to remove and return the top-most table card of each value in values,
+        for example a combination returned by find_combination.
+        Parameters: values - the card values to take
+        """
+        counts = self.counts()
+        for value in values:
+            counts[value] -= 1
+            if counts[value] < 0:
+                raise IndexError(f"There are not enough cards of value {value} on the table ")
+        return [self.__cards.pop(self.__by_value[value].pop()) for value in values]